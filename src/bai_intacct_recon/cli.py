@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 import logging
 import sys
+import time
 
 import click
 from rich.console import Console
@@ -15,14 +16,16 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .config import load_config, generate_default_config, ReconConfig
-from .parsers.bai2_parser import BAI2Parser
-from .parsers.intacct_parser import IntacctParser
-from .matching.engine import ReconciliationEngine
-from .reports.excel_generator import ExcelReportGenerator
 from .utils.logging_config import setup_logging
 
+# Parsers, engine and report generator are imported inside the commands that
+# use them, so pandas/openpyxl are only loaded when actually needed.
+
 console = Console()
 
+# Number of transactions shown by the parse-* preview commands
+PREVIEW_ROWS = 20
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -70,6 +73,11 @@ def reconcile(
     BAI2_FILE: Path to the BAI2 bank statement file
     INTACCT_FILE: Path to the Sage Intacct CSV export
     """
+    from .matching.engine import ReconciliationEngine
+    from .parsers.bai2_parser import BAI2Parser
+    from .parsers.intacct_parser import IntacctParser
+    from .reports.excel_generator import ExcelReportGenerator
+
     # Setup logging
     log_level = logging.DEBUG if verbose else logging.INFO
     setup_logging(log_level)
@@ -103,14 +111,14 @@ def reconcile(
 
             # Run reconciliation
             task = progress.add_task("Running reconciliation...", total=None)
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             engine = ReconciliationEngine(recon_config)
             matches, bank_only, intacct_only = engine.reconcile(
                 bank_transactions, intacct_transactions
             )
 
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             progress.update(task, completed=True)
 
             # Generate summary
@@ -164,11 +172,14 @@ def parse_bai2(bai2_file: Path, config: Optional[Path]):
 
     BAI2_FILE: Path to the BAI2 bank statement file
     """
+    from .parsers.bai2_parser import BAI2Parser
+
     recon_config = load_config(config)
     parser = BAI2Parser(recon_config)
 
     try:
-        transactions = parser.parse_file(bai2_file)
+        # Parse one row past the preview to detect whether more exist
+        transactions = parser.parse_file(bai2_file, limit=PREVIEW_ROWS + 1)
 
         table = Table(title=f"BAI2 Transactions: {bai2_file.name}")
         table.add_column("Date")
@@ -177,8 +188,8 @@ def parse_bai2(bai2_file: Path, config: Optional[Path]):
         table.add_column("Type")
         table.add_column("Description")
 
-        for txn in transactions[:20]:  # Show first 20
-            table.add_row(
+        rows = [
+            (
                 str(txn.date),
                 txn.reference or "-",
                 f"${txn.amount:,.2f}",
@@ -189,13 +200,13 @@ def parse_bai2(bai2_file: Path, config: Optional[Path]):
                     else txn.description
                 ),
             )
+            for txn in transactions[:PREVIEW_ROWS]
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
-
-        if len(transactions) > 20:
-            console.print(f"\n... and {len(transactions) - 20} more transactions")
-
-        console.print(f"\nTotal transactions: {len(transactions)}")
+        _print_preview_footer(len(transactions))
 
     except Exception as e:
         console.print(f"[red]Error parsing file: {e}[/red]")
@@ -211,11 +222,14 @@ def parse_intacct(intacct_file: Path, config: Optional[Path]):
 
     INTACCT_FILE: Path to the Sage Intacct CSV export
     """
+    from .parsers.intacct_parser import IntacctParser
+
     recon_config = load_config(config)
     parser = IntacctParser(recon_config)
 
     try:
-        transactions = parser.parse_file(intacct_file)
+        # Parse one row past the preview to detect whether more exist
+        transactions = parser.parse_file(intacct_file, limit=PREVIEW_ROWS + 1)
 
         table = Table(title=f"Intacct Transactions: {intacct_file.name}")
         table.add_column("Date")
@@ -224,21 +238,21 @@ def parse_intacct(intacct_file: Path, config: Optional[Path]):
         table.add_column("Type")
         table.add_column("GL Account")
 
-        for txn in transactions[:20]:  # Show first 20
-            table.add_row(
+        rows = [
+            (
                 str(txn.date),
                 txn.reference or "-",
                 f"${txn.amount:,.2f}",
                 txn.type.value,
                 txn.gl_account or "-",
             )
+            for txn in transactions[:PREVIEW_ROWS]
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
-
-        if len(transactions) > 20:
-            console.print(f"\n... and {len(transactions) - 20} more transactions")
-
-        console.print(f"\nTotal transactions: {len(transactions)}")
+        _print_preview_footer(len(transactions))
 
     except Exception as e:
         console.print(f"[red]Error parsing file: {e}[/red]")
@@ -255,6 +269,14 @@ def init_config(output: Path):
     console.print(f"[green]Configuration file generated: {output}[/green]")
 
 
+def _print_preview_footer(parsed_count: int) -> None:
+    """Print the footer for a parse-* preview of at most PREVIEW_ROWS transactions."""
+    if parsed_count > PREVIEW_ROWS:
+        console.print(f"\nShowing first {PREVIEW_ROWS} transactions (file contains more)")
+    else:
+        console.print(f"\nTotal transactions: {parsed_count}")
+
+
 def _display_summary(summary) -> None:
     """Display reconciliation summary in console."""
     table = Table(title="Reconciliation Summary")
@@ -276,24 +298,14 @@ def _display_summary(summary) -> None:
 
 def _apply_date_tolerance_override(config: ReconConfig, days: int) -> None:
     """Apply date tolerance override to all relevant tiers."""
-    matching_config = config.matching
-    tiers = matching_config.tiers if hasattr(matching_config, "tiers") else []
-
-    for tier in tiers:
-        for rule in tier.rules:
-            if rule.field == "date" and rule.match_type == "tolerance":
-                rule.tolerance_days = days
+    for rule in config.matching.rule_index.get(("date", "tolerance"), []):
+        rule.tolerance_days = days
 
 
 def _apply_amount_tolerance_override(config: ReconConfig, amount: float) -> None:
     """Apply amount tolerance override to all relevant tiers."""
-    matching_config = config.matching
-    tiers = matching_config.tiers if hasattr(matching_config, "tiers") else []
-
-    for tier in tiers:
-        for rule in tier.rules:
-            if rule.field == "amount" and rule.match_type == "tolerance":
-                rule.tolerance_amount = amount
+    for rule in config.matching.rule_index.get(("amount", "tolerance"), []):
+        rule.tolerance_amount = amount
 
 
 if __name__ == "__main__":
@@ -1,11 +1,22 @@
 """Configuration loader and validation for reconciliation settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Optional
+import copy
+import fnmatch
 import logging
+import re
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +45,8 @@ class InputConfig(BaseModel):
                 "gl_account": "GL_Account",
                 "transaction_id": "Transaction_ID",
             },
+            "parallel_workers": 1,  # Worker processes for large files; 0 uses all CPUs
+            "parallel_min_rows": 100000,  # Below this rows are processed serially
         }
     )
 
@@ -69,6 +82,8 @@ class MatchingSettings(BaseModel):
     case_sensitive: bool = False
     normalize_references: bool = True
     reference_normalize_pattern: str = "[^a-zA-Z0-9]"
+    parallel_workers: int = 1  # Worker processes per tier; 0 uses all CPUs
+    parallel_min_transactions: int = 20000  # Below this a tier runs serially
 
 
 class MatchingConfig(BaseModel):
@@ -77,10 +92,21 @@ class MatchingConfig(BaseModel):
     tiers: list[MatchingTier] = Field(default_factory=list)
     settings: MatchingSettings = Field(default_factory=MatchingSettings)
 
+    @cached_property
+    def rule_index(self) -> dict[tuple[str, str], list[MatchingRule]]:
+        """Rules across all tiers, keyed by (field, match_type)."""
+        index: dict[tuple[str, str], list[MatchingRule]] = {}
+        for tier in self.tiers:
+            for rule in tier.rules:
+                index.setdefault((rule.field, rule.match_type), []).append(rule)
+        return index
+
 
 class ExclusionsConfig(BaseModel):
     """Configuration for transaction exclusions."""
 
+    model_config = ConfigDict(frozen=True)
+
     bank_only_type_codes: list[int] = Field(default_factory=lambda: [561, 108])
     gl_only_account_patterns: list[str] = Field(
         default_factory=lambda: [
@@ -106,17 +132,47 @@ class ExclusionsConfig(BaseModel):
         ]
     )
 
+    @cached_property
+    def gl_account_matcher(self) -> Optional[re.Pattern[str]]:
+        """Single regex matching any GL-only account pattern (None if no patterns)."""
+        return _compile_glob_patterns(self.gl_only_account_patterns)
+
+    @cached_property
+    def gl_reference_matcher(self) -> Optional[re.Pattern[str]]:
+        """Single regex matching any GL-only reference pattern (None if no patterns)."""
+        return _compile_glob_patterns(self.gl_only_reference_patterns)
+
+
+def _compile_glob_patterns(patterns: list[str]) -> Optional[re.Pattern[str]]:
+    """
+    Compile fnmatch-style glob patterns into one alternation regex.
+
+    Args:
+        patterns: Glob patterns (e.g. "1200-*")
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
 
 class ExcelOutputConfig(BaseModel):
     """Configuration for Excel output."""
 
+    model_config = ConfigDict(frozen=True)
+
     filename_template: str = "reconciliation_report_{date}_{time}.xlsx"
     include_timestamp: bool = True
+    engine: str = "openpyxl"  # or "xlsxwriter" (optional, faster for large reports)
 
 
 class SheetConfig(BaseModel):
     """Configuration for a report sheet."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     name: str
 
@@ -144,6 +200,8 @@ class OutputConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Configuration for logging."""
 
+    model_config = ConfigDict(frozen=True)
+
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
@@ -159,9 +217,18 @@ class ReconConfig(BaseModel):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     config_file_path: Optional[str] = None
 
+    @cached_property
+    def type_descriptions(self) -> dict[int, str]:
+        """BAI2 type code descriptions across credits and debits."""
+        descriptions: dict[int, str] = {}
+        for category in ("credits", "debits"):
+            for code, desc in self.transaction_types.get(category, {}).items():
+                descriptions[int(code)] = desc
+        return descriptions
 
-def get_default_config() -> dict[str, Any]:
-    """Return the default configuration as a dictionary."""
+
+def _build_default_config() -> dict[str, Any]:
+    """Build the default configuration dictionary."""
     return {
         "input": {
             "bai2": {
@@ -182,6 +249,8 @@ def get_default_config() -> dict[str, Any]:
                     "gl_account": "GL_Account",
                     "transaction_id": "Transaction_ID",
                 },
+                "parallel_workers": 1,
+                "parallel_min_rows": 100000,
             },
         },
         "matching": {
@@ -264,6 +333,8 @@ def get_default_config() -> dict[str, Any]:
                 "case_sensitive": False,
                 "normalize_references": True,
                 "reference_normalize_pattern": "[^a-zA-Z0-9]",
+                "parallel_workers": 1,
+                "parallel_min_transactions": 20000,
             },
         },
         "transaction_types": {
@@ -307,6 +378,7 @@ def get_default_config() -> dict[str, Any]:
             "excel": {
                 "filename_template": "reconciliation_report_{date}_{time}.xlsx",
                 "include_timestamp": True,
+                "engine": "openpyxl",
             },
             "sheets": {
                 "summary": {"enabled": True, "name": "Summary"},
@@ -324,6 +396,15 @@ def get_default_config() -> dict[str, Any]:
     }
 
 
+# Built once at import; callers receive deep copies so the cache is never mutated
+_DEFAULT_CONFIG = _build_default_config()
+
+
+def get_default_config() -> dict[str, Any]:
+    """Return a fresh copy of the default configuration as a dictionary."""
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+
 def load_config(config_path: Optional[Path] = None) -> ReconConfig:
     """
     Load configuration from a YAML file or use defaults.
@@ -338,38 +419,53 @@ def load_config(config_path: Optional[Path] = None) -> ReconConfig:
 
     if config_path and config_path.exists():
         logger.info(f"Loading configuration from: {config_path}")
-        with open(config_path, "r") as f:
-            user_config = yaml.safe_load(f) or {}
+        user_config = yaml.load(config_path.read_bytes(), Loader=SafeLoader) or {}
 
-        # Deep merge user config into defaults
-        config_dict = _deep_merge(config_dict, user_config)
+        # Deep merge user config into the (freshly copied) defaults
+        _deep_merge(config_dict, user_config)
         config_dict["config_file_path"] = str(config_path)
     else:
         logger.info("Using default configuration")
 
-    return ReconConfig(**config_dict)
+    return ReconConfig.model_validate(config_dict)
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
     """
-    Deep merge two dictionaries.
+    Deep merge one dictionary into another, in place.
 
     Args:
-        base: Base dictionary
+        base: Base dictionary (modified in place; pass a copy if it must be kept)
         override: Dictionary to merge on top
 
     Returns:
-        Merged dictionary
+        The merged base dictionary
     """
-    result = base.copy()
+    stack = [(base, override)]
+
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                stack.append((target[key], value))
+            else:
+                target[key] = value
+
+    return base
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
 
-    return result
+@lru_cache(maxsize=1)
+def _default_config_yaml() -> str:
+    """Render the default configuration as commented YAML (computed once)."""
+    # Add helpful comments by using a custom YAML representer
+    yaml_content = """# BAI2 to Sage Intacct Reconciliation Configuration
+# Generated configuration file - customize as needed
+
+"""
+    yaml_content += yaml.dump(
+        _DEFAULT_CONFIG, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+    )
+    return yaml_content
 
 
 def generate_default_config(output_path: Path) -> None:
@@ -379,17 +475,7 @@ def generate_default_config(output_path: Path) -> None:
     Args:
         output_path: Path to write the configuration file
     """
-    config_dict = get_default_config()
-
-    # Add helpful comments by using a custom YAML representer
-    yaml_content = """# BAI2 to Sage Intacct Reconciliation Configuration
-# Generated configuration file - customize as needed
-
-"""
-    yaml_content += yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(yaml_content)
+    output_path.write_text(_default_config_yaml())
 
     logger.info(f"Generated configuration file: {output_path}")
@@ -3,11 +3,16 @@ Multi-tier matching engine for transaction reconciliation.
 Implements configurable matching strategies with priority ordering.
 """
 
-from datetime import datetime
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
-import fnmatch
+from operator import attrgetter
+from typing import Any, Collection, Iterable, Optional
+import heapq
 import logging
+import os
+import time
 
 from ..models.transaction import (
     NormalizedTransaction,
@@ -17,7 +22,10 @@ from ..models.transaction import (
     ReconciliationSummary,
 )
 from ..config import ReconConfig
+from ..utils.logging_config import worker_logging_initializer
 from .strategies import (
+    EXACT_MATCH_REASON,
+    exact_match_key,
     MatchingStrategy,
     ExactMatchStrategy,
     FuzzyDateStrategy,
@@ -27,6 +35,51 @@ from .strategies import (
 
 logger = logging.getLogger(__name__)
 
+# Shard match result: (bank position, Intacct positions, score, reason,
+# amount variance, date variance) - positions index the shard's input lists
+_ShardMatch = tuple[int, list[int], float, str, Optional[Decimal], Optional[int]]
+
+
+def _match_shard(
+    strategy: MatchingStrategy,
+    tier_name: str,
+    bank_txns: list[NormalizedTransaction],
+    intacct_txns: list[NormalizedTransaction],
+) -> list[_ShardMatch]:
+    """
+    Match one shard of a tier in a worker process.
+
+    Results refer to transactions by position, since the worker only sees
+    pickled copies of them.
+
+    Args:
+        strategy: Matching strategy to use
+        tier_name: Name of the tier
+        bank_txns: Bank transactions in the shard
+        intacct_txns: Intacct candidates in the shard
+
+    Returns:
+        List of shard match results
+    """
+    intacct_positions = {id(txn): position for position, txn in enumerate(intacct_txns)}
+    index = strategy.prepare(intacct_txns)
+
+    results: list[_ShardMatch] = []
+    for bank_position, bank_txn in enumerate(bank_txns):
+        match_result = strategy.evaluate(bank_txn, index, tier_name)
+        if match_result:
+            results.append(
+                (
+                    bank_position,
+                    [intacct_positions[id(txn)] for txn in match_result.intacct_transactions],
+                    match_result.match_score,
+                    match_result.match_reason,
+                    match_result.amount_variance,
+                    match_result.date_variance_days,
+                )
+            )
+    return results
+
 
 class ReconciliationEngine:
     """
@@ -46,6 +99,16 @@ class ReconciliationEngine:
         self.config = config
         self.strategies = self._build_strategies()
 
+        # Resolve exclusion rules once rather than per transaction
+        exclusions = config.exclusions
+        self._bank_only_type_codes = frozenset(exclusions.bank_only_type_codes or ())
+        self._gl_account_matcher = exclusions.gl_account_matcher
+        self._gl_reference_matcher = exclusions.gl_reference_matcher
+
+        settings = config.matching.settings
+        self._parallel_workers = settings.parallel_workers or os.cpu_count() or 1
+        self._parallel_min_transactions = settings.parallel_min_transactions
+
     def _build_strategies(self) -> list[tuple[str, MatchingStrategy]]:
         """
         Build matching strategies from configuration.
@@ -148,64 +211,100 @@ class ReconciliationEngine:
         Returns:
             Tuple of (matched_results, bank_only, intacct_only)
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info(
             f"Starting reconciliation: {len(bank_transactions)} bank txns, "
             f"{len(intacct_transactions)} Intacct txns"
         )
 
         # Filter out excluded transactions
-        bank_txns, bank_excluded = self._filter_exclusions(
-            bank_transactions, source="bank"
-        )
-        intacct_txns, intacct_excluded = self._filter_exclusions(
-            intacct_transactions, source="intacct"
+        bank_txns, bank_excluded = self._filter_bank_exclusions(bank_transactions)
+        intacct_txns, intacct_excluded = self._filter_intacct_exclusions(
+            intacct_transactions
         )
 
-        # Track unmatched transactions
-        unmatched_bank = {txn.id: txn for txn in bank_txns}
-        unmatched_intacct = {txn.id: txn for txn in intacct_txns}
+        # Track unmatched transactions, split by type once up front since
+        # matching never crosses transaction types
+        bank_pool = {txn.id: txn for txn in bank_txns}
+        intacct_pool = {txn.id: txn for txn in intacct_txns}
+        unmatched_bank = self._split_by_type(bank_pool.values())
+        unmatched_intacct = self._split_by_type(intacct_pool.values())
+        bank_positions = {txn_id: position for position, txn_id in enumerate(bank_pool)}
+
+        # Shard attribute values present on the Intacct side, per type. Bank
+        # transactions without one of these values can never match in tiers
+        # sharded on that attribute (all the reference tiers), so they are
+        # skipped there. Pools only shrink, so the sets stay valid supersets.
+        candidate_keys = {
+            attribute: self._collect_keys(unmatched_intacct, attribute)
+            for attribute in {
+                strategy.shard_attribute
+                for _, strategy in self.strategies
+                if strategy.shard_attribute
+            }
+        }
 
         matches: list[MatchResult] = []
 
-        # Process each tier in priority order
-        for tier_name, strategy in self.strategies:
-            logger.debug(f"Processing matching tier: {tier_name}")
-
-            # Find matches for this tier
-            tier_matches = self._find_tier_matches(
-                list(unmatched_bank.values()),
-                list(unmatched_intacct.values()),
-                strategy,
-                tier_name,
+        # Sharded tiers run on a worker pool when parallel matching is enabled
+        worker_pool: AbstractContextManager[Optional[Executor]] = nullcontext()
+        if self._parallel_workers > 1:
+            initializer, initargs = worker_logging_initializer()
+            worker_pool = ProcessPoolExecutor(
+                max_workers=self._parallel_workers, initializer=initializer, initargs=initargs
             )
 
-            # Remove matched transactions from unmatched pools
-            for match in tier_matches:
-                if match.bank_transaction.id in unmatched_bank:
-                    del unmatched_bank[match.bank_transaction.id]
-                    match.bank_transaction.is_matched = True
-                    match.bank_transaction.match_tier = tier_name
-
-                for intacct_txn in match.intacct_transactions:
-                    if intacct_txn.id in unmatched_intacct:
-                        del unmatched_intacct[intacct_txn.id]
-                        intacct_txn.is_matched = True
-                        intacct_txn.match_tier = tier_name
-
-            matches.extend(tier_matches)
-
-            logger.debug(
-                f"Tier {tier_name}: {len(tier_matches)} matches found, "
-                f"{len(unmatched_bank)} bank and {len(unmatched_intacct)} "
-                f"Intacct remaining"
-            )
+        with worker_pool as executor:
+            # Process each tier in priority order
+            for tier_name, strategy in self.strategies:
+                logger.debug(f"Processing matching tier: {tier_name}")
+
+                # Find matches for this tier
+                tier_matches = self._find_tier_matches(
+                    unmatched_bank,
+                    unmatched_intacct,
+                    strategy,
+                    tier_name,
+                    bank_positions,
+                    executor,
+                    candidate_keys.get(strategy.shard_attribute or ""),
+                )
 
-        # Combine unmatched with excluded
-        bank_only = list(unmatched_bank.values()) + bank_excluded
-        intacct_only = list(unmatched_intacct.values()) + intacct_excluded
+                # Remove matched transactions from unmatched pools
+                for match in tier_matches:
+                    bank_txn = match.bank_transaction
+                    bank_remaining = unmatched_bank[bank_txn.type]
+                    if bank_txn.id in bank_remaining:
+                        del bank_remaining[bank_txn.id]
+                        bank_txn.is_matched = True
+                        bank_txn.match_tier = tier_name
+
+                    for intacct_txn in match.intacct_transactions:
+                        pool = unmatched_intacct[intacct_txn.type]
+                        if intacct_txn.id in pool:
+                            del pool[intacct_txn.id]
+                            intacct_txn.is_matched = True
+                            intacct_txn.match_tier = tier_name
+
+                matches.extend(tier_matches)
+
+                bank_remaining_count = sum(len(pool) for pool in unmatched_bank.values())
+                intacct_remaining = sum(len(pool) for pool in unmatched_intacct.values())
+                logger.debug(
+                    f"Tier {tier_name}: {len(tier_matches)} matches found, "
+                    f"{bank_remaining_count} bank and {intacct_remaining} "
+                    f"Intacct remaining"
+                )
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        # Combine unmatched with excluded, keeping the original order
+        bank_only = [
+            txn for txn in bank_pool.values() if txn.id in unmatched_bank[txn.type]
+        ] + bank_excluded
+        intacct_only = [
+            txn for txn in intacct_pool.values() if txn.id in unmatched_intacct[txn.type]
+        ] + intacct_excluded
+
+        elapsed = time.perf_counter() - start_time
         logger.info(
             f"Reconciliation complete in {elapsed:.2f}s: {len(matches)} matches, "
             f"{len(bank_only)} bank-only, {len(intacct_only)} Intacct-only"
@@ -213,131 +312,328 @@ class ReconciliationEngine:
 
         return matches, bank_only, intacct_only
 
-    def _filter_exclusions(
+    @staticmethod
+    def _collect_keys(
+        by_type: dict[TransactionType, dict[str, NormalizedTransaction]],
+        attribute: str,
+    ) -> dict[TransactionType, set[Any]]:
+        """
+        Collect the set values of an attribute across transactions, by type.
+
+        Args:
+            by_type: Transactions by type, keyed by ID
+            attribute: Transaction attribute to collect
+
+        Returns:
+            Non-null attribute values by type
+        """
+        get_key = attrgetter(attribute)
+        return {
+            txn_type: {get_key(txn) for txn in txns.values()} - {None}
+            for txn_type, txns in by_type.items()
+        }
+
+    @staticmethod
+    def _split_by_type(
+        transactions: Iterable[NormalizedTransaction],
+    ) -> dict[TransactionType, dict[str, NormalizedTransaction]]:
+        """
+        Bucket transactions by type, keyed by ID.
+
+        Args:
+            transactions: Transactions to bucket
+
+        Returns:
+            Transactions by type, in their original order
+        """
+        by_type: dict[TransactionType, dict[str, NormalizedTransaction]] = {
+            TransactionType.CREDIT: {},
+            TransactionType.DEBIT: {},
+        }
+        for txn in transactions:
+            by_type[txn.type][txn.id] = txn
+        return by_type
+
+    def _filter_bank_exclusions(
+        self,
+        transactions: list[NormalizedTransaction],
+    ) -> tuple[list[NormalizedTransaction], list[NormalizedTransaction]]:
+        """
+        Filter out bank transactions with bank-only BAI2 type codes.
+
+        Args:
+            transactions: List of bank transactions to filter
+
+        Returns:
+            Tuple of (included, excluded) transactions
+        """
+        included: list[NormalizedTransaction] = []
+        excluded: list[NormalizedTransaction] = []
+        include = included.append
+        exclude = excluded.append
+
+        bank_only_codes = self._bank_only_type_codes
+
+        for txn in transactions:
+            if txn.bai2_type_code in bank_only_codes:
+                exclude(txn)
+            else:
+                include(txn)
+
+        return included, excluded
+
+    def _filter_intacct_exclusions(
         self,
         transactions: list[NormalizedTransaction],
-        source: str,
     ) -> tuple[list[NormalizedTransaction], list[NormalizedTransaction]]:
         """
-        Filter out transactions that should be excluded from matching.
+        Filter out Intacct transactions matching GL account or reference patterns.
 
         Args:
-            transactions: List of transactions to filter
-            source: "bank" or "intacct"
+            transactions: List of Intacct transactions to filter
 
         Returns:
             Tuple of (included, excluded) transactions
         """
+        gl_matcher = self._gl_account_matcher
+        ref_matcher = self._gl_reference_matcher
+        if not gl_matcher and not ref_matcher:
+            return list(transactions), []
+
         included: list[NormalizedTransaction] = []
         excluded: list[NormalizedTransaction] = []
+        include = included.append
+        exclude = excluded.append
 
-        exclusions = self.config.exclusions
+        gl_match = gl_matcher.match if gl_matcher else None
+        ref_match = ref_matcher.match if ref_matcher else None
 
         for txn in transactions:
-            is_excluded = False
-
-            if source == "bank":
-                # Check BAI2 type code exclusions
-                bank_only_codes = exclusions.bank_only_type_codes or []
-                if txn.bai2_type_code in bank_only_codes:
-                    is_excluded = True
-
-            elif source == "intacct":
-                # Check GL account pattern exclusions
-                gl_patterns = exclusions.gl_only_account_patterns or []
-                if txn.gl_account:
-                    for pattern in gl_patterns:
-                        if fnmatch.fnmatch(txn.gl_account, pattern):
-                            is_excluded = True
-                            break
-
-                # Check reference pattern exclusions
-                if not is_excluded and txn.reference:
-                    ref_patterns = exclusions.gl_only_reference_patterns or []
-                    for pattern in ref_patterns:
-                        if fnmatch.fnmatch(txn.reference, pattern):
-                            is_excluded = True
-                            break
-
-            if is_excluded:
-                excluded.append(txn)
+            if (gl_match and txn.gl_account and gl_match(txn.gl_account)) or (
+                ref_match and txn.reference and ref_match(txn.reference)
+            ):
+                exclude(txn)
             else:
-                included.append(txn)
+                include(txn)
 
         return included, excluded
 
     def _find_tier_matches(
         self,
-        bank_txns: list[NormalizedTransaction],
-        intacct_txns: list[NormalizedTransaction],
+        bank_by_type: dict[TransactionType, dict[str, NormalizedTransaction]],
+        intacct_by_type: dict[TransactionType, dict[str, NormalizedTransaction]],
         strategy: MatchingStrategy,
         tier_name: str,
+        bank_positions: dict[str, int],
+        executor: Optional[Executor] = None,
+        candidate_keys: Optional[dict[TransactionType, set[Any]]] = None,
     ) -> list[MatchResult]:
         """
         Find matches for a specific matching tier.
 
         Args:
-            bank_txns: Unmatched bank transactions
-            intacct_txns: Unmatched Intacct transactions
+            bank_by_type: Unmatched bank transactions by type, keyed by ID
+            intacct_by_type: Unmatched Intacct transactions by type, keyed by ID
             strategy: Matching strategy to use
             tier_name: Name of the tier for logging
+            bank_positions: Original position of each bank transaction ID
+            executor: Worker pool for large shardable tiers, or None to run serially
+            candidate_keys: Shard attribute values that can match, by type; bank
+                transactions without one of them are skipped
 
         Returns:
-            List of match results
+            List of match results, in bank transaction order
         """
-        matches: list[MatchResult] = []
+        matches_by_type: list[list[MatchResult]] = []
+
+        for txn_type, bank_pool in bank_by_type.items():
+            candidates = intacct_by_type[txn_type]
+            if not bank_pool or not candidates:
+                continue
+
+            bank_txns: Collection[NormalizedTransaction] = bank_pool.values()
+            if candidate_keys is not None and strategy.shard_attribute:
+                get_key = attrgetter(strategy.shard_attribute)
+                keys = candidate_keys[txn_type]
+                bank_txns = [txn for txn in bank_txns if get_key(txn) in keys]
+                if not bank_txns:
+                    continue
+
+            if (
+                executor
+                and strategy.shard_attribute
+                and len(bank_txns) + len(candidates) >= self._parallel_min_transactions
+            ):
+                matches_by_type.append(
+                    self._find_sharded_matches(
+                        executor,
+                        bank_txns,
+                        candidates.values(),
+                        strategy,
+                        strategy.shard_attribute,
+                        tier_name,
+                        bank_positions,
+                    )
+                )
+                continue
+
+            # Build the lookup index once per type for the whole tier; strategies
+            # drop consumed candidates from it as matches are made
+            index = strategy.prepare(candidates.values())
+            if type(strategy) is ExactMatchStrategy:
+                matches_by_type.append(
+                    self._find_exact_matches(bank_txns, index, tier_name)
+                )
+                continue
+
+            type_matches: list[MatchResult] = []
+            for bank_txn in bank_txns:
+                match_result = strategy.evaluate(bank_txn, index, tier_name)
+                if match_result:
+                    type_matches.append(match_result)
+            matches_by_type.append(type_matches)
+
+        if len(matches_by_type) == 1:
+            return matches_by_type[0]
+
+        # Interleave the per-type results back into bank transaction order
+        return list(
+            heapq.merge(
+                *matches_by_type,
+                key=lambda match: bank_positions[match.bank_transaction.id],
+            )
+        )
 
-        # Index Intacct transactions by type for faster lookup
-        intacct_by_type: dict[TransactionType, list[NormalizedTransaction]] = {
-            TransactionType.CREDIT: [],
-            TransactionType.DEBIT: [],
-        }
+    def _find_sharded_matches(
+        self,
+        executor: Executor,
+        bank_txns: Iterable[NormalizedTransaction],
+        intacct_txns: Iterable[NormalizedTransaction],
+        strategy: MatchingStrategy,
+        shard_attribute: str,
+        tier_name: str,
+        bank_positions: dict[str, int],
+    ) -> list[MatchResult]:
+        """
+        Match one transaction type of a tier across worker processes.
+
+        Transactions are grouped by the strategy's shard attribute, which
+        partitions the matching, so each group is matched independently and
+        the results are identical to the serial path.
+
+        Args:
+            executor: Worker pool
+            bank_txns: Unmatched bank transactions of one type
+            intacct_txns: Unmatched Intacct transactions of the same type
+            strategy: Shardable matching strategy
+            shard_attribute: The strategy's shard attribute
+            tier_name: Name of the tier
+            bank_positions: Original position of each bank transaction ID
+
+        Returns:
+            List of match results, in bank transaction order
+        """
+        get_key = attrgetter(shard_attribute)
+
+        bank_groups: dict[Any, list[NormalizedTransaction]] = {}
+        for txn in bank_txns:
+            key = get_key(txn)
+            if key is not None:
+                bank_groups.setdefault(key, []).append(txn)
+
+        intacct_groups: dict[Any, list[NormalizedTransaction]] = {}
         for txn in intacct_txns:
-            intacct_by_type[txn.type].append(txn)
+            key = get_key(txn)
+            if key in bank_groups:
+                intacct_groups.setdefault(key, []).append(txn)
+
+        # Deal groups that can match onto shards, largest first, to balance the load
+        shard_count = self._parallel_workers
+        shards: list[tuple[list[NormalizedTransaction], list[NormalizedTransaction]]] = [
+            ([], []) for _ in range(shard_count)
+        ]
+        keys = sorted(
+            intacct_groups,
+            key=lambda k: len(bank_groups[k]) * len(intacct_groups[k]),
+            reverse=True,
+        )
+        for shard_number, key in enumerate(keys):
+            shard_bank, shard_intacct = shards[shard_number % shard_count]
+            shard_bank.extend(bank_groups[key])
+            shard_intacct.extend(intacct_groups[key])
+
+        shards = [shard for shard in shards if shard[0]]
+        futures = [
+            executor.submit(_match_shard, strategy, tier_name, shard_bank, shard_intacct)
+            for shard_bank, shard_intacct in shards
+        ]
+
+        # Rebuild results against the original transaction objects
+        matches: list[MatchResult] = []
+        for (shard_bank, shard_intacct), future in zip(shards, futures, strict=True):
+            for bank_position, intacct_positions, score, reason, amount_var, date_var in (
+                future.result()
+            ):
+                matches.append(
+                    MatchResult(
+                        bank_transaction=shard_bank[bank_position],
+                        intacct_transactions=[shard_intacct[p] for p in intacct_positions],
+                        match_tier=tier_name,
+                        match_score=score,
+                        match_reason=reason,
+                        amount_variance=amount_var,
+                        date_variance_days=date_var,
+                    )
+                )
 
-        # Track which Intacct transactions have been matched in this tier
-        matched_intacct_ids: set[str] = set()
+        matches.sort(key=lambda match: bank_positions[match.bank_transaction.id])
+        return matches
+
+    @staticmethod
+    def _find_exact_matches(
+        bank_txns: Iterable[NormalizedTransaction],
+        index: dict[tuple[str, int, int], list[NormalizedTransaction]],
+        tier_name: str,
+    ) -> list[MatchResult]:
+        """
+        Find exact matches with a direct index lookup per bank transaction.
+
+        Inlines ExactMatchStrategy.evaluate(), whose score and reason are
+        constant, to avoid per-transaction strategy dispatch in the usually
+        busiest tier.
+
+        Args:
+            bank_txns: Unmatched bank transactions of one type
+            index: Index built by ExactMatchStrategy.prepare()
+            tier_name: Name of the tier, recorded on the results
+
+        Returns:
+            List of match results
+        """
+        matches: list[MatchResult] = []
 
         for bank_txn in bank_txns:
-            # Only match with same transaction type
-            candidates = [
-                t
-                for t in intacct_by_type.get(bank_txn.type, [])
-                if t.id not in matched_intacct_ids
-            ]
-
-            # Find matching transactions
-            matched_intacct = strategy.find_matches(bank_txn, candidates)
-
-            if matched_intacct:
-                # Calculate match details
-                score, reason = strategy.calculate_match_score(bank_txn, matched_intacct)
-
-                # Calculate variances
-                amount_variance: Optional[Decimal] = None
-                date_variance: Optional[int] = None
-
-                if len(matched_intacct) == 1:
-                    intacct_txn = matched_intacct[0]
-                    if bank_txn.amount != intacct_txn.amount:
-                        amount_variance = bank_txn.amount - intacct_txn.amount
-                    if bank_txn.date != intacct_txn.date:
-                        date_variance = abs((bank_txn.date - intacct_txn.date).days)
-
-                match_result = MatchResult(
+            if not bank_txn.normalized_reference:
+                continue
+
+            key = exact_match_key(bank_txn)
+            bucket = index.get(key)
+            if not bucket:
+                continue
+
+            intacct_txn = bucket.pop(0)
+            if not bucket:
+                del index[key]
+
+            matches.append(
+                MatchResult(
                     bank_transaction=bank_txn,
-                    intacct_transactions=matched_intacct,
+                    intacct_transactions=[intacct_txn],
                     match_tier=tier_name,
-                    match_score=score,
-                    match_reason=reason,
-                    amount_variance=amount_variance,
-                    date_variance_days=date_variance,
+                    match_score=1.0,
+                    match_reason=EXACT_MATCH_REASON,
                 )
-                matches.append(match_result)
-
-                # Mark Intacct transactions as matched
-                for intacct_txn in matched_intacct:
-                    matched_intacct_ids.add(intacct_txn.id)
+            )
 
         return matches
 
@@ -368,44 +664,51 @@ class ReconciliationEngine:
         Returns:
             Reconciliation summary object
         """
-        # Calculate totals
-        bank_credits = sum(
-            t.amount for t in bank_transactions if t.type == TransactionType.CREDIT
-        )
-        bank_debits = sum(
-            t.amount for t in bank_transactions if t.type == TransactionType.DEBIT
-        )
-        intacct_credits = sum(
-            t.amount for t in intacct_transactions if t.type == TransactionType.CREDIT
-        )
-        intacct_debits = sum(
-            t.amount for t in intacct_transactions if t.type == TransactionType.DEBIT
-        )
-
-        # Calculate total variance
-        total_variance = sum(
-            (m.amount_variance for m in matches if m.amount_variance), Decimal("0")
-        )
+        credit = TransactionType.CREDIT
+
+        # Bank totals and statement period in a single pass
+        bank_credits = Decimal("0")
+        bank_debits = Decimal("0")
+        period_start: Optional[date] = None
+        period_end: Optional[date] = None
+        for txn in bank_transactions:
+            if txn.type is credit:
+                bank_credits += txn.amount
+            else:
+                bank_debits += txn.amount
+            if period_start is None or txn.date < period_start:
+                period_start = txn.date
+            if period_end is None or txn.date > period_end:
+                period_end = txn.date
+
+        # Intacct totals
+        intacct_credits = Decimal("0")
+        intacct_debits = Decimal("0")
+        for txn in intacct_transactions:
+            if txn.type is credit:
+                intacct_credits += txn.amount
+            else:
+                intacct_debits += txn.amount
 
-        # Count matches by tier
+        # Tier counts, total variance and variance count in a single pass
         tier_counts: dict[str, int] = {}
+        total_variance = Decimal("0")
+        variance_count = 0
         for match in matches:
             tier_counts[match.match_tier] = tier_counts.get(match.match_tier, 0) + 1
+            if match.amount_variance:
+                total_variance += match.amount_variance
+                variance_count += 1
 
-        # Determine statement period
-        all_dates = [t.date for t in bank_transactions]
-        period_start = min(all_dates) if all_dates else datetime.now().date()
-        period_end = max(all_dates) if all_dates else datetime.now().date()
-
-        # Count variances (matches with amount differences)
-        variance_count = sum(1 for m in matches if m.amount_variance)
+        # Default the statement period to today when there are no bank transactions
+        today = datetime.now().date()
 
         return ReconciliationSummary(
             bai2_filename=bai2_filename,
             intacct_filename=intacct_filename,
             reconciliation_date=datetime.now(),
-            statement_period_start=period_start,
-            statement_period_end=period_end,
+            statement_period_start=period_start or today,
+            statement_period_end=period_end or today,
             total_bank_transactions=len(bank_transactions),
             total_intacct_transactions=len(intacct_transactions),
             matched_count=len(matches),
@@ -4,17 +4,42 @@ Each strategy implements a specific matching approach.
 """
 
 from abc import ABC, abstractmethod
-from decimal import Decimal
+from bisect import bisect_left, bisect_right
+from decimal import ROUND_FLOOR, Decimal
 from difflib import SequenceMatcher
-from typing import Optional
-import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional
 
-from ..models.transaction import NormalizedTransaction
+from ..models.transaction import MatchResult, NormalizedTransaction
+
+# rapidfuzz (optional, "fast" extra) provides a C++ Indel similarity that is
+# an upper bound on difflib's ratio, used to prune candidates cheaply
+_indel_ratio: Optional[Callable[..., float]]
+try:
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+except ImportError:  # pragma: no cover - optional dependency
+    _indel_ratio = None
+
+# Slack for float rounding when comparing an upper bound against a floor
+_BOUND_EPSILON = 1e-9
+
+EXACT_MATCH_REASON = "Exact match on reference, amount, and date"
+
+# Exact-match index key: (normalized reference, amount in cents, date ordinal)
+exact_match_key = attrgetter("normalized_reference", "amount_cents", "date_ordinal")
 
 
 class MatchingStrategy(ABC):
     """Abstract base class for matching strategies."""
 
+    # Transaction attribute that partitions matching: a bank and an Intacct
+    # transaction can only match when it is equal (and set) on both. The
+    # engine uses it to skip bank transactions with no possible candidate and
+    # to shard a tier across worker processes; None disables both. The three
+    # reference tiers all require reference equality.
+    shard_attribute: Optional[str] = None
+
     @abstractmethod
     def find_matches(
         self,
@@ -51,6 +76,207 @@ class MatchingStrategy(ABC):
         """
         pass
 
+    def prepare(self, intacct_candidates: Iterable[NormalizedTransaction]) -> Any:
+        """
+        Build a lookup index over the candidates for one tier pass.
+
+        The default index is a plain list searched with find_matches();
+        strategies override this with a structure suited to their keys.
+
+        Args:
+            intacct_candidates: Unmatched Intacct transactions of one type
+
+        Returns:
+            Strategy-specific index passed to find_indexed_matches()
+        """
+        return list(intacct_candidates)
+
+    def find_indexed_matches(
+        self, bank_txn: NormalizedTransaction, index: Any
+    ) -> list[NormalizedTransaction]:
+        """
+        Find matches using an index built by prepare().
+
+        Matched candidates are removed from the index so they cannot be
+        matched again in the same tier.
+
+        Args:
+            bank_txn: Bank transaction to match
+            index: Index returned by prepare()
+
+        Returns:
+            List of matching Intacct transactions (may be empty)
+        """
+        matches = self.find_matches(bank_txn, index)
+        if matches:
+            matched = {id(t) for t in matches}
+            index[:] = [t for t in index if id(t) not in matched]
+        return matches
+
+    def evaluate(
+        self, bank_txn: NormalizedTransaction, index: Any, tier_name: str
+    ) -> Optional[MatchResult]:
+        """
+        Find, score and record a match for a bank transaction in one call.
+
+        The default combines find_indexed_matches() and
+        calculate_match_score(); built-in strategies override it to reuse
+        the diffs computed while matching.
+
+        Args:
+            bank_txn: Bank transaction to match
+            index: Index returned by prepare()
+            tier_name: Name of the tier, recorded on the result
+
+        Returns:
+            Match result, or None if nothing matched
+        """
+        matched_intacct = self.find_indexed_matches(bank_txn, index)
+        if not matched_intacct:
+            return None
+
+        score, reason = self.calculate_match_score(bank_txn, matched_intacct)
+        return _build_match_result(bank_txn, matched_intacct, tier_name, score, reason)
+
+
+def _build_match_result(
+    bank_txn: NormalizedTransaction,
+    matched_intacct: list[NormalizedTransaction],
+    tier_name: str,
+    score: float,
+    reason: str,
+    date_diff: Optional[int] = None,
+) -> MatchResult:
+    """
+    Build a match result, recording variances for one-to-one matches.
+
+    Args:
+        bank_txn: Bank transaction
+        matched_intacct: Matched Intacct transactions
+        tier_name: Name of the matching tier
+        score: Match confidence score
+        reason: Match reason
+        date_diff: Day difference, if already known
+
+    Returns:
+        Match result
+    """
+    amount_variance: Optional[Decimal] = None
+    date_variance: Optional[int] = None
+
+    if len(matched_intacct) == 1:
+        intacct_txn = matched_intacct[0]
+        if bank_txn.amount_cents != intacct_txn.amount_cents:
+            amount_variance = bank_txn.amount - intacct_txn.amount
+        if date_diff is None:
+            date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
+        if date_diff:
+            date_variance = date_diff
+
+    return MatchResult(
+        bank_transaction=bank_txn,
+        intacct_transactions=matched_intacct,
+        match_tier=tier_name,
+        match_score=score,
+        match_reason=reason,
+        amount_variance=amount_variance,
+        date_variance_days=date_variance,
+    )
+
+
+def _bounded_similarity(bank_desc: str, intacct_desc: str, floor: float) -> Optional[float]:
+    """
+    Compute the SequenceMatcher ratio unless it provably falls below a floor.
+
+    Args:
+        bank_desc: Normalized bank description
+        intacct_desc: Normalized Intacct description
+        floor: Minimum similarity of interest
+
+    Returns:
+        Similarity ratio (0.0-1.0), or None if it must be below floor
+    """
+    # Indel similarity counts the longest common subsequence, which is never
+    # shorter than the matching blocks difflib finds, so it bounds ratio()
+    if _indel_ratio is not None and bank_desc and intacct_desc:
+        cutoff = (floor - _BOUND_EPSILON) * 100
+        if _indel_ratio(bank_desc, intacct_desc, score_cutoff=cutoff) == 0:
+            return None
+
+    matcher = SequenceMatcher(None, bank_desc, intacct_desc)
+    if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+        return None
+    return _description_similarity(bank_desc, intacct_desc)
+
+
+@lru_cache(maxsize=100_000)
+def _description_similarity(bank_desc: str, intacct_desc: str) -> float:
+    """SequenceMatcher ratio of two normalized descriptions, memoized."""
+    return SequenceMatcher(None, bank_desc, intacct_desc).ratio()
+
+
+class _DateBucket:
+    """Same-reference candidates sorted by date, remembering their original order."""
+
+    __slots__ = ("ordinals", "entries")
+
+    def __init__(self, candidates: list[tuple[int, NormalizedTransaction]]):
+        """
+        Initialize from (sequence, transaction) pairs in original order.
+
+        Args:
+            candidates: Candidates tagged with their position in the tier pool
+        """
+        # Stable sort keeps original order among candidates on the same date
+        candidates.sort(key=lambda entry: entry[1].date_ordinal)
+        self.ordinals = [txn.date_ordinal for _, txn in candidates]
+        self.entries = candidates
+
+    def window(self, ordinal: int, tolerance_days: int) -> range:
+        """Positions of candidates dated within tolerance_days of ordinal."""
+        return range(
+            bisect_left(self.ordinals, ordinal - tolerance_days),
+            bisect_right(self.ordinals, ordinal + tolerance_days),
+        )
+
+    def pop(self, position: int) -> NormalizedTransaction:
+        """Remove and return the candidate at a position."""
+        del self.ordinals[position]
+        return self.entries.pop(position)[1]
+
+
+def _index_by_reference_and_date(
+    intacct_candidates: Iterable[NormalizedTransaction],
+) -> dict[str, _DateBucket]:
+    """Group candidates by normalized reference into date-sorted buckets."""
+    grouped: dict[str, list[tuple[int, NormalizedTransaction]]] = {}
+    for sequence, intacct_txn in enumerate(intacct_candidates):
+        if intacct_txn.normalized_reference:
+            grouped.setdefault(intacct_txn.normalized_reference, []).append(
+                (sequence, intacct_txn)
+            )
+    return {reference: _DateBucket(entries) for reference, entries in grouped.items()}
+
+
+def _pop_dated_candidate(
+    index: dict[str, _DateBucket], reference: str, position: int
+) -> NormalizedTransaction:
+    """Remove and return a candidate from a date bucket, dropping empty buckets."""
+    bucket = index[reference]
+    match = bucket.pop(position)
+    if not bucket.entries:
+        del index[reference]
+    return match
+
+
+def _pop_candidate(index: dict[Any, list[Any]], key: Any, position: int) -> Any:
+    """Remove and return an entry from an index bucket, dropping empty buckets."""
+    bucket = index[key]
+    match = bucket.pop(position)
+    if not bucket:
+        del index[key]
+    return match
+
 
 class ExactMatchStrategy(MatchingStrategy):
     """
@@ -58,6 +284,8 @@ class ExactMatchStrategy(MatchingStrategy):
     Highest confidence matching tier.
     """
 
+    shard_attribute = "normalized_reference"
+
     def find_matches(
         self,
         bank_txn: NormalizedTransaction,
@@ -75,7 +303,7 @@ class ExactMatchStrategy(MatchingStrategy):
             # Check exact match on all fields
             if (
                 bank_txn.normalized_reference == intacct_txn.normalized_reference
-                and bank_txn.amount == intacct_txn.amount
+                and bank_txn.amount_cents == intacct_txn.amount_cents
                 and bank_txn.date == intacct_txn.date
             ):
                 matches.append(intacct_txn)
@@ -83,13 +311,53 @@ class ExactMatchStrategy(MatchingStrategy):
         # Return first match only for exact matching
         return matches[:1] if matches else []
 
+    def prepare(
+        self, intacct_candidates: Iterable[NormalizedTransaction]
+    ) -> dict[tuple[str, int, int], list[NormalizedTransaction]]:
+        """Index candidates by (normalized reference, amount in cents, date ordinal)."""
+        index: dict[tuple[str, int, int], list[NormalizedTransaction]] = {}
+        for intacct_txn in intacct_candidates:
+            if intacct_txn.normalized_reference:
+                index.setdefault(exact_match_key(intacct_txn), []).append(intacct_txn)
+        return index
+
+    def find_indexed_matches(
+        self,
+        bank_txn: NormalizedTransaction,
+        index: dict[tuple[str, int, int], list[NormalizedTransaction]],
+    ) -> list[NormalizedTransaction]:
+        """Take the first candidate sharing the bank transaction's key."""
+        if not bank_txn.normalized_reference:
+            return []
+
+        key = exact_match_key(bank_txn)
+        if key not in index:
+            return []
+        return [_pop_candidate(index, key, 0)]
+
     def calculate_match_score(
         self,
         bank_txn: NormalizedTransaction,
         matched_intacct: list[NormalizedTransaction],
     ) -> tuple[float, str]:
         """Exact matches have perfect score."""
-        return 1.0, "Exact match on reference, amount, and date"
+        return 1.0, EXACT_MATCH_REASON
+
+    def evaluate(
+        self, bank_txn: NormalizedTransaction, index: Any, tier_name: str
+    ) -> Optional[MatchResult]:
+        """Exact matches have a fixed score and no variances."""
+        matched_intacct = self.find_indexed_matches(bank_txn, index)
+        if not matched_intacct:
+            return None
+
+        return MatchResult(
+            bank_transaction=bank_txn,
+            intacct_transactions=matched_intacct,
+            match_tier=tier_name,
+            match_score=1.0,
+            match_reason=EXACT_MATCH_REASON,
+        )
 
 
 class FuzzyDateStrategy(MatchingStrategy):
@@ -97,6 +365,8 @@ class FuzzyDateStrategy(MatchingStrategy):
     Fuzzy date matching - exact reference and amount, date within tolerance.
     """
 
+    shard_attribute = "normalized_reference"
+
     def __init__(self, tolerance_days: int = 3):
         """
         Initialize with date tolerance.
@@ -123,19 +393,53 @@ class FuzzyDateStrategy(MatchingStrategy):
             # Check reference and amount match exactly
             if (
                 bank_txn.normalized_reference == intacct_txn.normalized_reference
-                and bank_txn.amount == intacct_txn.amount
+                and bank_txn.amount_cents == intacct_txn.amount_cents
             ):
                 # Check date within tolerance
-                date_diff = abs((bank_txn.date - intacct_txn.date).days)
+                date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
                 if date_diff <= self.tolerance_days:
                     matches.append(intacct_txn)
 
         # Return closest date match
         if matches:
-            matches.sort(key=lambda t: abs((bank_txn.date - t.date).days))
+            matches.sort(key=lambda t: abs(bank_txn.date_ordinal - t.date_ordinal))
             return matches[:1]
         return []
 
+    def prepare(
+        self, intacct_candidates: Iterable[NormalizedTransaction]
+    ) -> dict[str, _DateBucket]:
+        """Index candidates by normalized reference, sorted by date."""
+        return _index_by_reference_and_date(intacct_candidates)
+
+    def find_indexed_matches(
+        self,
+        bank_txn: NormalizedTransaction,
+        index: dict[str, _DateBucket],
+    ) -> list[NormalizedTransaction]:
+        """Take the closest-dated candidate sharing the bank transaction's reference."""
+        reference = bank_txn.normalized_reference
+        if not reference or reference not in index:
+            return []
+
+        bucket = index[reference]
+        best_position: Optional[int] = None
+        best_key: Optional[tuple[int, int]] = None
+        for position in bucket.window(bank_txn.date_ordinal, self.tolerance_days):
+            sequence, intacct_txn = bucket.entries[position]
+            if bank_txn.amount_cents != intacct_txn.amount_cents:
+                continue
+
+            # Closest date first; ties keep the earliest candidate
+            key = (abs(bank_txn.date_ordinal - intacct_txn.date_ordinal), sequence)
+            if best_key is None or key < best_key:
+                best_position = position
+                best_key = key
+
+        if best_position is None:
+            return []
+        return [_pop_dated_candidate(index, reference, best_position)]
+
     def calculate_match_score(
         self,
         bank_txn: NormalizedTransaction,
@@ -146,8 +450,25 @@ class FuzzyDateStrategy(MatchingStrategy):
             return 0.0, "No match"
 
         intacct_txn = matched_intacct[0]
-        date_diff = abs((bank_txn.date - intacct_txn.date).days)
+        date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
+        return self._score(date_diff)
+
+    def evaluate(
+        self, bank_txn: NormalizedTransaction, index: Any, tier_name: str
+    ) -> Optional[MatchResult]:
+        """Find the closest-dated match and score it from the same day difference."""
+        matched_intacct = self.find_indexed_matches(bank_txn, index)
+        if not matched_intacct:
+            return None
+
+        date_diff = abs(bank_txn.date_ordinal - matched_intacct[0].date_ordinal)
+        score, reason = self._score(date_diff)
+        return _build_match_result(
+            bank_txn, matched_intacct, tier_name, score, reason, date_diff=date_diff
+        )
 
+    def _score(self, date_diff: int) -> tuple[float, str]:
+        """Score a match from its day difference."""
         # Score decreases with date difference
         score = max(0.8, 1.0 - (date_diff * 0.05))
         reason = f"Reference and amount match, {date_diff} day(s) date difference"
@@ -160,6 +481,8 @@ class AmountToleranceStrategy(MatchingStrategy):
     Amount tolerance matching - allows small differences in amounts.
     """
 
+    shard_attribute = "normalized_reference"
+
     def __init__(
         self,
         date_tolerance_days: int = 5,
@@ -178,6 +501,10 @@ class AmountToleranceStrategy(MatchingStrategy):
         self.amount_tolerance = amount_tolerance
         self.percent_tolerance = percent_tolerance
 
+        # Whole-cent equivalent of the absolute tolerance; cent differences are
+        # integers, so flooring leaves the comparison unchanged
+        self._amount_tolerance_cents = int((amount_tolerance * 100).to_integral_value(ROUND_FLOOR))
+
     def find_matches(
         self,
         bank_txn: NormalizedTransaction,
@@ -187,7 +514,6 @@ class AmountToleranceStrategy(MatchingStrategy):
         if not bank_txn.normalized_reference:
             return []
 
-        matches: list[NormalizedTransaction] = []
         for intacct_txn in intacct_candidates:
             if not intacct_txn.normalized_reference:
                 continue
@@ -196,26 +522,60 @@ class AmountToleranceStrategy(MatchingStrategy):
             if bank_txn.normalized_reference != intacct_txn.normalized_reference:
                 continue
 
-            # Check date within tolerance
-            date_diff = abs((bank_txn.date - intacct_txn.date).days)
-            if date_diff > self.date_tolerance_days:
-                continue
+            if self._within_tolerance(bank_txn, intacct_txn):
+                return [intacct_txn]
 
-            # Check amount within tolerance
-            amount_diff = abs(bank_txn.amount - intacct_txn.amount)
+        return []
 
-            # Check absolute tolerance
-            if amount_diff <= self.amount_tolerance:
-                matches.append(intacct_txn)
-                continue
+    def prepare(
+        self, intacct_candidates: Iterable[NormalizedTransaction]
+    ) -> dict[str, _DateBucket]:
+        """Index candidates by normalized reference, sorted by date."""
+        return _index_by_reference_and_date(intacct_candidates)
 
-            # Check percentage tolerance
-            if bank_txn.amount > 0:
-                percent_diff = (amount_diff / bank_txn.amount) * 100
-                if percent_diff <= self.percent_tolerance:
-                    matches.append(intacct_txn)
+    def find_indexed_matches(
+        self,
+        bank_txn: NormalizedTransaction,
+        index: dict[str, _DateBucket],
+    ) -> list[NormalizedTransaction]:
+        """Take the first candidate sharing the reference and within tolerances."""
+        reference = bank_txn.normalized_reference
+        if not reference or reference not in index:
+            return []
 
-        return matches[:1] if matches else []
+        bucket = index[reference]
+        best_position: Optional[int] = None
+        best_sequence = 0
+        for position in bucket.window(bank_txn.date_ordinal, self.date_tolerance_days):
+            sequence, intacct_txn = bucket.entries[position]
+            if best_position is not None and sequence > best_sequence:
+                continue
+            if self._within_tolerance(bank_txn, intacct_txn):
+                best_position = position
+                best_sequence = sequence
+
+        if best_position is None:
+            return []
+        return [_pop_dated_candidate(index, reference, best_position)]
+
+    def _within_tolerance(
+        self, bank_txn: NormalizedTransaction, intacct_txn: NormalizedTransaction
+    ) -> bool:
+        """Check the date and amount tolerances for a same-reference candidate."""
+        # Check date within tolerance
+        date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
+        if date_diff > self.date_tolerance_days:
+            return False
+
+        # Check absolute tolerance (integer cents)
+        amount_diff_cents = abs(bank_txn.amount_cents - intacct_txn.amount_cents)
+        if amount_diff_cents <= self._amount_tolerance_cents:
+            return True
+
+        # Check percentage tolerance, cross-multiplied to avoid division
+        if bank_txn.amount_cents > 0:
+            return amount_diff_cents * 100 <= self.percent_tolerance * bank_txn.amount_cents
+        return False
 
     def calculate_match_score(
         self,
@@ -226,9 +586,27 @@ class AmountToleranceStrategy(MatchingStrategy):
         if not matched_intacct:
             return 0.0, "No match"
 
-        intacct_txn = matched_intacct[0]
+        return self._score(bank_txn, matched_intacct[0])[:2]
+
+    def evaluate(
+        self, bank_txn: NormalizedTransaction, index: Any, tier_name: str
+    ) -> Optional[MatchResult]:
+        """Find a match and score it from the same amount and day differences."""
+        matched_intacct = self.find_indexed_matches(bank_txn, index)
+        if not matched_intacct:
+            return None
+
+        score, reason, date_diff = self._score(bank_txn, matched_intacct[0])
+        return _build_match_result(
+            bank_txn, matched_intacct, tier_name, score, reason, date_diff=date_diff
+        )
+
+    def _score(
+        self, bank_txn: NormalizedTransaction, intacct_txn: NormalizedTransaction
+    ) -> tuple[float, str, int]:
+        """Score a match from its amount variance; also returns the day difference."""
         amount_diff = abs(bank_txn.amount - intacct_txn.amount)
-        date_diff = abs((bank_txn.date - intacct_txn.date).days)
+        date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
 
         # Base score
         score = 0.75
@@ -243,7 +621,7 @@ class AmountToleranceStrategy(MatchingStrategy):
             f"{date_diff} day(s) date difference"
         )
 
-        return score, reason
+        return score, reason, date_diff
 
 
 class FuzzyDescriptionStrategy(MatchingStrategy):
@@ -252,6 +630,8 @@ class FuzzyDescriptionStrategy(MatchingStrategy):
     Lowest confidence tier, used as fallback.
     """
 
+    shard_attribute = "amount_cents"
+
     def __init__(
         self, similarity_threshold: float = 0.85, date_tolerance_days: int = 7
     ):
@@ -274,28 +654,29 @@ class FuzzyDescriptionStrategy(MatchingStrategy):
         if not bank_txn.description:
             return []
 
-        bank_desc = self._normalize_description(bank_txn.description)
+        bank_desc = bank_txn.normalized_description
 
         best_match: Optional[NormalizedTransaction] = None
         best_score = 0.0
 
         for intacct_txn in intacct_candidates:
             # Amount must match exactly for description matching
-            if bank_txn.amount != intacct_txn.amount:
+            if bank_txn.amount_cents != intacct_txn.amount_cents:
                 continue
 
             # Check date within tolerance
-            date_diff = abs((bank_txn.date - intacct_txn.date).days)
+            date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
             if date_diff > self.date_tolerance_days:
                 continue
 
             if not intacct_txn.description:
                 continue
 
-            intacct_desc = self._normalize_description(intacct_txn.description)
-
             # Calculate similarity
-            similarity = SequenceMatcher(None, bank_desc, intacct_desc).ratio()
+            floor = max(self.similarity_threshold, best_score)
+            similarity = _bounded_similarity(bank_desc, intacct_txn.normalized_description, floor)
+            if similarity is None:
+                continue
 
             if similarity >= self.similarity_threshold and similarity > best_score:
                 best_match = intacct_txn
@@ -303,15 +684,70 @@ class FuzzyDescriptionStrategy(MatchingStrategy):
 
         return [best_match] if best_match else []
 
-    def _normalize_description(self, description: str) -> str:
-        """Normalize description for comparison."""
-        # Convert to lowercase
-        desc = description.lower()
-        # Remove special characters
-        desc = re.sub(r"[^a-z0-9\s]", "", desc)
-        # Normalize whitespace
-        desc = " ".join(desc.split())
-        return desc
+    def prepare(
+        self, intacct_candidates: Iterable[NormalizedTransaction]
+    ) -> dict[int, list[NormalizedTransaction]]:
+        """Index candidates by amount in cents."""
+        index: dict[int, list[NormalizedTransaction]] = {}
+        for intacct_txn in intacct_candidates:
+            if intacct_txn.description:
+                index.setdefault(intacct_txn.amount_cents, []).append(intacct_txn)
+        return index
+
+    def find_indexed_matches(
+        self,
+        bank_txn: NormalizedTransaction,
+        index: dict[int, list[NormalizedTransaction]],
+    ) -> list[NormalizedTransaction]:
+        """Take the most similar same-amount candidate within the date tolerance."""
+        best = self._take_best(bank_txn, index)
+        return [best[0]] if best else []
+
+    def evaluate(
+        self, bank_txn: NormalizedTransaction, index: Any, tier_name: str
+    ) -> Optional[MatchResult]:
+        """Find the most similar match and score it from the same similarity."""
+        best = self._take_best(bank_txn, index)
+        if best is None:
+            return None
+
+        intacct_txn, similarity = best
+        score, reason = self._score(similarity)
+        return _build_match_result(bank_txn, [intacct_txn], tier_name, score, reason)
+
+    def _take_best(
+        self,
+        bank_txn: NormalizedTransaction,
+        index: dict[int, list[NormalizedTransaction]],
+    ) -> Optional[tuple[NormalizedTransaction, float]]:
+        """Remove and return the best candidate from the index with its similarity."""
+        if not bank_txn.description or bank_txn.amount_cents not in index:
+            return None
+
+        bank_desc = bank_txn.normalized_description
+
+        best_position: Optional[int] = None
+        best_score = 0.0
+
+        for position, intacct_txn in enumerate(index[bank_txn.amount_cents]):
+            date_diff = abs(bank_txn.date_ordinal - intacct_txn.date_ordinal)
+            if date_diff > self.date_tolerance_days:
+                continue
+
+            # Skip candidates that could not reach the threshold or beat the best
+            floor = max(self.similarity_threshold, best_score)
+            similarity = _bounded_similarity(bank_desc, intacct_txn.normalized_description, floor)
+            if similarity is None:
+                continue
+
+            if similarity >= self.similarity_threshold and similarity > best_score:
+                best_position = position
+                best_score = similarity
+
+        if best_position is None:
+            return None
+
+        return _pop_candidate(index, bank_txn.amount_cents, best_position), best_score
 
     def calculate_match_score(
         self,
@@ -323,12 +759,13 @@ class FuzzyDescriptionStrategy(MatchingStrategy):
             return 0.0, "No match"
 
         intacct_txn = matched_intacct[0]
+        similarity = _description_similarity(
+            bank_txn.normalized_description, intacct_txn.normalized_description
+        )
+        return self._score(similarity)
 
-        bank_desc = self._normalize_description(bank_txn.description)
-        intacct_desc = self._normalize_description(intacct_txn.description)
-
-        similarity = SequenceMatcher(None, bank_desc, intacct_desc).ratio()
-
+    def _score(self, similarity: float) -> tuple[float, str]:
+        """Score a match from its description similarity."""
         # Lower base score for fuzzy matches
         score = 0.5 + (similarity * 0.3)
         reason = f"Description similarity: {similarity:.1%}"
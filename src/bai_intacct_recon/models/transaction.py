@@ -6,6 +6,16 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Optional
 import re
+import sys
+
+# Characters stripped when normalizing references for matching
+_REFERENCE_STRIP_RE = re.compile(r"[^a-zA-Z0-9]")
+
+# Characters stripped when normalizing descriptions for fuzzy comparison
+_DESCRIPTION_STRIP_RE = re.compile(r"[^a-z0-9\s]")
+
+# The same characters as a bytes.translate() deletion table, for ASCII descriptions
+_DESCRIPTION_STRIP_BYTES = bytes(b for b in range(128) if _DESCRIPTION_STRIP_RE.match(chr(b)))
 
 
 class TransactionSource(Enum):
@@ -14,6 +24,10 @@ class TransactionSource(Enum):
     BAI2 = "bai2"
     INTACCT = "intacct"
 
+    # Members are singletons compared by identity, so hash by identity in C
+    # rather than through Enum.__hash__ when used as dict keys
+    __hash__ = object.__hash__
+
 
 class TransactionType(Enum):
     """Transaction type (debit or credit from bank's perspective)."""
@@ -21,8 +35,10 @@ class TransactionType(Enum):
     CREDIT = "credit"  # Money in (deposits, wire-in)
     DEBIT = "debit"  # Money out (checks, wire-out, fees)
 
+    __hash__ = object.__hash__
+
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedTransaction:
     """
     Normalized transaction representation for reconciliation matching.
@@ -55,6 +71,15 @@ class NormalizedTransaction:
     # Transaction description
     description: str = ""
 
+    # Normalized description (lowercase, special chars stripped, whitespace collapsed)
+    normalized_description: str = field(default="", init=False, repr=False)
+
+    # Amount in integer cents, for fast equality checks and index keys
+    amount_cents: int = field(default=0, init=False, repr=False)
+
+    # Proleptic Gregorian ordinal of the date, for cheap day differences
+    date_ordinal: int = field(default=0, init=False, repr=False)
+
     # BAI2-specific fields
     bai2_type_code: Optional[int] = None
     bai2_type_description: Optional[str] = None
@@ -64,22 +89,51 @@ class NormalizedTransaction:
     gl_account: Optional[str] = None
     intacct_transaction_id: Optional[str] = None
 
-    # Original raw data for audit trail
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    # Original raw data for audit trail (None when not captured)
+    raw_data: Optional[dict[str, Any]] = None
 
     # Matching state
     is_matched: bool = False
     match_tier: Optional[str] = None
-    matched_with: list[str] = field(default_factory=list)
+    # IDs of counterpart transactions, allocated only once a match is recorded
+    matched_with: Optional[list[str]] = None
 
-    def __post_init__(self) -> None:
-        """Normalize reference after initialization."""
-        if self.reference and not self.normalized_reference:
-            # Remove special characters, convert to uppercase
-            self.normalized_reference = re.sub(r"[^a-zA-Z0-9]", "", self.reference).upper()
+    @property
+    def bucket_key(self) -> tuple[int, int]:
+        """(amount in cents, date ordinal) key for grouping same-amount, same-day candidates."""
+        return self.amount_cents, self.date_ordinal
 
+    def __post_init__(self) -> None:
+        """Normalize reference and description and derive numeric keys after initialization."""
+        self.amount_cents = int((self.amount * 100).to_integral_value())
+        self.date_ordinal = self.date.toordinal()
 
-@dataclass
+        if self.reference and not self.normalized_reference:
+            # Remove special characters, convert to uppercase; plain ASCII
+            # alphanumeric references need no stripping
+            reference = self.reference
+            if not (reference.isascii() and reference.isalnum()):
+                reference = _REFERENCE_STRIP_RE.sub("", reference)
+            self.normalized_reference = reference.upper()
+
+        # Intern the join keys: references and GL accounts repeat heavily and are
+        # hashed and compared on every index lookup
+        if self.normalized_reference:
+            self.normalized_reference = sys.intern(self.normalized_reference)
+        if self.gl_account:
+            self.gl_account = sys.intern(self.gl_account)
+
+        if self.description:
+            desc = self.description.lower()
+            if desc.isascii():
+                # Byte-level deletion is much cheaper than the regex substitution
+                desc = desc.encode().translate(None, _DESCRIPTION_STRIP_BYTES).decode()
+            else:
+                desc = _DESCRIPTION_STRIP_RE.sub("", desc)
+            self.normalized_description = " ".join(desc.split())
+
+
+@dataclass(slots=True)
 class MatchResult:
     """Result of a transaction match attempt."""
 
@@ -99,6 +153,13 @@ class MatchResult:
     # Timestamp for audit
     matched_at: datetime = field(default_factory=datetime.now)
 
+    # Sum of all matched Intacct transaction amounts, computed once at construction
+    total_intacct_amount: Decimal = field(default=Decimal("0"), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Total the matched Intacct amounts after initialization."""
+        self.total_intacct_amount = sum((t.amount for t in self.intacct_transactions), Decimal("0"))
+
     @property
     def is_exact_match(self) -> bool:
         """Check if this is a perfect match."""
@@ -106,13 +167,8 @@ class MatchResult:
             self.date_variance_days is None or self.date_variance_days == 0
         )
 
-    @property
-    def total_intacct_amount(self) -> Decimal:
-        """Sum of all matched Intacct transaction amounts."""
-        return sum((t.amount for t in self.intacct_transactions), Decimal("0"))
-
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationSummary:
     """Summary of the reconciliation process."""
 
@@ -1,6 +1,22 @@
 """Parsers for BAI2 and Sage Intacct files."""
 
-from .bai2_parser import BAI2Parser
-from .intacct_parser import IntacctParser
+from importlib import import_module
+from typing import Any
 
 __all__ = ["BAI2Parser", "IntacctParser"]
+
+# Parsers are imported on first access, so the BAI2 path never loads pandas
+_PARSER_MODULES = {
+    "BAI2Parser": ".bai2_parser",
+    "IntacctParser": ".intacct_parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a parser class the first time it is accessed."""
+    module_name = _PARSER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parser = getattr(import_module(module_name, __name__), name)
+    globals()[name] = parser
+    return parser
@@ -3,10 +3,11 @@ BAI2 file parser with fallback custom parser.
 Converts BAI2 transactions into normalized transaction models.
 """
 
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 import logging
 import re
 
@@ -16,6 +17,7 @@ from ..models.transaction import (
     TransactionType,
 )
 from ..config import ReconConfig
+from ..utils.dates import parse_date
 from ..utils.exceptions import BAI2ParseError
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,35 @@ logger = logging.getLogger(__name__)
 CREDIT_TYPE_CODE_RANGE = range(100, 400)
 DEBIT_TYPE_CODE_RANGE = range(400, 700)
 
+# Padding for type 16 records that omit trailing optional fields
+_EMPTY_OPTIONAL_FIELDS = ["", "", "", ""]
+
+# Transaction type for every known type code, resolved with a single lookup
+_TYPE_CODE_TRANSACTION_TYPES: dict[int, TransactionType] = {
+    **dict.fromkeys(CREDIT_TYPE_CODE_RANGE, TransactionType.CREDIT),
+    **dict.fromkeys(DEBIT_TYPE_CODE_RANGE, TransactionType.DEBIT),
+}
+
+
+def _cents_to_dollars(amount_cents: int) -> Decimal:
+    """
+    Convert an integer cent amount to dollars without string round-trips.
+
+    Trailing zero cents are dropped, matching Decimal division by 100
+    (e.g. 12300 -> Decimal("123"), 12340 -> Decimal("123.4")).
+
+    Args:
+        amount_cents: Amount in cents
+
+    Returns:
+        Amount in dollars
+    """
+    if amount_cents % 100 == 0:
+        return Decimal(amount_cents // 100)
+    if amount_cents % 10 == 0:
+        return Decimal(amount_cents // 10).scaleb(-1)
+    return Decimal(amount_cents).scaleb(-2)
+
 
 class BAI2Parser:
     """
@@ -44,26 +75,26 @@ class BAI2Parser:
             config: Application configuration object
         """
         self.config = config
-        self.type_descriptions = self._build_type_descriptions()
-
-    def _build_type_descriptions(self) -> dict[int, str]:
-        """Build a mapping of type codes to descriptions from config."""
-        descriptions: dict[int, str] = {}
-        transaction_types = self.config.transaction_types or {}
-
-        for code, desc in transaction_types.get("credits", {}).items():
-            descriptions[int(code)] = desc
-        for code, desc in transaction_types.get("debits", {}).items():
-            descriptions[int(code)] = desc
+        # Built once per config and shared by every parser instance
+        self.type_descriptions = config.type_descriptions
 
-        return descriptions
-
-    def parse_file(self, file_path: Path) -> list[NormalizedTransaction]:
+        # Resolve file settings once rather than on every parse
+        input_config = config.input
+        bai2_config = input_config.bai2 if hasattr(input_config, "bai2") else {}
+        if not isinstance(bai2_config, dict):
+            bai2_config = {}
+        self.encoding: str = bai2_config.get("encoding", "utf-8")
+        self.date_format: str = bai2_config.get("date_format", "%y%m%d")
+
+    def parse_file(
+        self, file_path: Path, limit: Optional[int] = None
+    ) -> list[NormalizedTransaction]:
         """
         Parse a BAI2 file and return normalized transactions.
 
         Args:
             file_path: Path to the BAI2 file
+            limit: Stop after this many transactions (optional, for previews)
 
         Returns:
             List of normalized transactions
@@ -74,18 +105,8 @@ class BAI2Parser:
         logger.info(f"Parsing BAI2 file: {file_path}")
 
         try:
-            input_config = self.config.input
-            bai2_config = input_config.bai2 if hasattr(input_config, "bai2") else {}
-            encoding = (
-                bai2_config.get("encoding", "utf-8")
-                if isinstance(bai2_config, dict)
-                else "utf-8"
-            )
-
-            with open(file_path, "r", encoding=encoding) as f:
-                content = f.read()
-
-            transactions = list(self._parse_bai2_content(content))
+            with open(file_path, "r", encoding=self.encoding) as f:
+                transactions = list(islice(self._parse_bai2_content(f), limit))
             logger.info(f"Extracted {len(transactions)} transactions from BAI2 file")
 
             return transactions
@@ -93,18 +114,18 @@ class BAI2Parser:
             logger.error(f"Failed to parse BAI2 file: {e}")
             raise BAI2ParseError(f"Failed to parse BAI2 file: {e}") from e
 
-    def _parse_bai2_content(self, content: str) -> Iterator[NormalizedTransaction]:
+    def _parse_bai2_content(self, raw_lines: Iterable[str]) -> Iterator[NormalizedTransaction]:
         """
         Parse BAI2 content using custom parser.
 
         Args:
-            content: BAI2 file content as string
+            raw_lines: BAI2 file lines, such as an open file
 
         Yields:
             Normalized transaction objects
         """
         # Remove trailing slashes and join continuation lines
-        lines = self._preprocess_bai2(content)
+        lines = self._iter_bai2_records(raw_lines)
 
         # Parse context
         statement_date: Optional[date] = None
@@ -115,26 +136,27 @@ class BAI2Parser:
             if not line.strip():
                 continue
 
-            record_type = line.split(",")[0] if "," in line else ""
+            # Split each record once; the type 16 text field is last and may
+            # itself contain commas, so stop after the six fields before it
+            parts = line.split(",", 6)
+            record_type = parts[0] if len(parts) > 1 else ""
 
             if record_type == "02":
                 # Group header - extract statement date
-                parts = line.split(",")
                 if len(parts) >= 5:
                     date_str = parts[4]  # as_of_date field
                     statement_date = self._parse_bai2_date(date_str)
 
             elif record_type == "03":
                 # Account identifier
-                parts = line.split(",")
-                if len(parts) >= 1:
-                    account_number = parts[1] if len(parts) > 1 else "UNKNOWN"
+                account_number = parts[1]
 
             elif record_type == "16":
                 # Transaction detail
                 transaction_count += 1
                 txn = self._parse_transaction_record(
                     line,
+                    parts,
                     statement_date or date.today(),
                     account_number,
                     transaction_count,
@@ -142,21 +164,20 @@ class BAI2Parser:
                 if txn:
                     yield txn
 
-    def _preprocess_bai2(self, content: str) -> list[str]:
+    def _iter_bai2_records(self, raw_lines: Iterable[str]) -> Iterator[str]:
         """
-        Preprocess BAI2 content - handle continuation lines and trailing slashes.
+        Preprocess BAI2 lines - handle continuation lines and trailing slashes.
+
+        Records are yielded as they complete, so only the current logical
+        record is held in memory.
 
         Args:
-            content: Raw BAI2 file content
+            raw_lines: Raw BAI2 file lines
 
-        Returns:
-            List of complete record lines
+        Yields:
+            Complete record lines
         """
-        # Split by lines
-        raw_lines = content.strip().split("\n")
-
         # Remove trailing slashes and handle continuation (88 records)
-        processed_lines: list[str] = []
         current_line = ""
 
         for line in raw_lines:
@@ -173,20 +194,19 @@ class BAI2Parser:
                 # Append to previous line (remove "88," prefix)
                 current_line += line[3:]
             else:
-                # Save previous line if exists
+                # Emit previous line if exists
                 if current_line:
-                    processed_lines.append(current_line)
+                    yield current_line
                 current_line = line
 
-        # Add final line
+        # Emit final line
         if current_line:
-            processed_lines.append(current_line)
-
-        return processed_lines
+            yield current_line
 
     def _parse_transaction_record(
         self,
         line: str,
+        parts: list[str],
         statement_date: date,
         account_number: str,
         sequence: int,
@@ -199,6 +219,7 @@ class BAI2Parser:
 
         Args:
             line: Transaction record line
+            parts: Record fields, split at most six times so text keeps its commas
             statement_date: Date from group header
             account_number: Bank account number
             sequence: Transaction sequence number
@@ -206,36 +227,38 @@ class BAI2Parser:
         Returns:
             Normalized transaction or None if parsing fails
         """
-        parts = line.split(",")
-
         if len(parts) < 3:
             logger.warning(f"Invalid transaction record: {line}")
             return None
 
         try:
-            # Parse fields
-            type_code = int(parts[1])
-            amount_cents = int(parts[2])
+            # Unpack all seven fields at once, padding missing optional ones
+            if len(parts) < 7:
+                parts = (parts + _EMPTY_OPTIONAL_FIELDS)[:7]
+            (
+                _,
+                type_field,
+                amount_field,
+                funds_type,
+                bank_reference,
+                customer_reference,
+                text,
+            ) = parts
 
-            # Optional fields
-            funds_type = parts[3] if len(parts) > 3 else ""
-            bank_reference = parts[4] if len(parts) > 4 else ""
-            customer_reference = parts[5] if len(parts) > 5 else ""
-            text = parts[6] if len(parts) > 6 else ""
+            # Parse fields
+            type_code = int(type_field)
+            amount_cents = int(amount_field)
 
             # Determine transaction type from type code
-            if type_code in CREDIT_TYPE_CODE_RANGE:
-                txn_type = TransactionType.CREDIT
-            elif type_code in DEBIT_TYPE_CODE_RANGE:
-                txn_type = TransactionType.DEBIT
-            else:
+            txn_type = _TYPE_CODE_TRANSACTION_TYPES.get(type_code)
+            if txn_type is None:
                 logger.warning(
                     f"Unknown BAI2 type code: {type_code}, defaulting to DEBIT"
                 )
                 txn_type = TransactionType.DEBIT
 
             # Convert amount from cents to dollars
-            amount_dollars = Decimal(str(amount_cents)) / Decimal("100")
+            amount_dollars = _cents_to_dollars(amount_cents)
 
             # Use bank_reference as the primary reference
             reference = bank_reference if bank_reference else customer_reference
@@ -280,16 +303,8 @@ class BAI2Parser:
         if not date_str:
             return date.today()
 
-        input_config = self.config.input
-        bai2_config = input_config.bai2 if hasattr(input_config, "bai2") else {}
-        date_format = (
-            bai2_config.get("date_format", "%y%m%d")
-            if isinstance(bai2_config, dict)
-            else "%y%m%d"
-        )
-
         try:
-            return datetime.strptime(date_str, date_format).date()
+            return parse_date(date_str, self.date_format)
         except ValueError:
             logger.warning(f"Could not parse BAI2 date: {date_str}")
             return date.today()
@@ -304,19 +319,6 @@ class BAI2Parser:
         Returns:
             Dictionary with file summary information
         """
-        input_config = self.config.input
-        bai2_config = input_config.bai2 if hasattr(input_config, "bai2") else {}
-        encoding = (
-            bai2_config.get("encoding", "utf-8")
-            if isinstance(bai2_config, dict)
-            else "utf-8"
-        )
-
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
-
-        lines = self._preprocess_bai2(content)
-
         summary: dict = {
             "sender_id": "",
             "receiver_id": "",
@@ -327,41 +329,42 @@ class BAI2Parser:
         current_group: Optional[dict] = None
         current_account: Optional[dict] = None
 
-        for line in lines:
-            parts = line.split(",")
-            record_type = parts[0] if parts else ""
-
-            if record_type == "01":
-                # File header
-                if len(parts) > 1:
-                    summary["sender_id"] = parts[1]
-                if len(parts) > 2:
-                    summary["receiver_id"] = parts[2]
-                if len(parts) > 3:
-                    summary["file_creation_date"] = parts[3]
-
-            elif record_type == "02":
-                # Group header
-                current_group = {
-                    "originator_id": parts[1] if len(parts) > 1 else "",
-                    "as_of_date": parts[4] if len(parts) > 4 else "",
-                    "accounts": [],
-                }
-                summary["groups"].append(current_group)
-
-            elif record_type == "03":
-                # Account identifier
-                if current_group is not None:
-                    current_account = {
-                        "account_number": parts[1] if len(parts) > 1 else "",
-                        "currency": parts[2] if len(parts) > 2 else "USD",
-                        "transaction_count": 0,
+        with open(file_path, "r", encoding=self.encoding) as f:
+            for line in self._iter_bai2_records(f):
+                parts = line.split(",")
+                record_type = parts[0] if parts else ""
+
+                if record_type == "01":
+                    # File header
+                    if len(parts) > 1:
+                        summary["sender_id"] = parts[1]
+                    if len(parts) > 2:
+                        summary["receiver_id"] = parts[2]
+                    if len(parts) > 3:
+                        summary["file_creation_date"] = parts[3]
+
+                elif record_type == "02":
+                    # Group header
+                    current_group = {
+                        "originator_id": parts[1] if len(parts) > 1 else "",
+                        "as_of_date": parts[4] if len(parts) > 4 else "",
+                        "accounts": [],
                     }
-                    current_group["accounts"].append(current_account)
-
-            elif record_type == "16":
-                # Transaction detail
-                if current_account is not None:
-                    current_account["transaction_count"] += 1
+                    summary["groups"].append(current_group)
+
+                elif record_type == "03":
+                    # Account identifier
+                    if current_group is not None:
+                        current_account = {
+                            "account_number": parts[1] if len(parts) > 1 else "",
+                            "currency": parts[2] if len(parts) > 2 else "USD",
+                            "transaction_count": 0,
+                        }
+                        current_group["accounts"].append(current_account)
+
+                elif record_type == "16":
+                    # Transaction detail
+                    if current_account is not None:
+                        current_account["transaction_count"] += 1
 
         return summary
@@ -3,11 +3,16 @@ Sage Intacct CSV transaction parser.
 Parses exported CSV files and converts to normalized transaction models.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, cast
+import importlib.util
+import itertools
 import logging
+import math
+import os
 
 import pandas as pd
 
@@ -17,10 +22,15 @@ from ..models.transaction import (
     TransactionType,
 )
 from ..config import ReconConfig
+from ..utils.dates import parse_date
 from ..utils.exceptions import IntacctParseError
+from ..utils.logging_config import worker_logging_initializer
 
 logger = logging.getLogger(__name__)
 
+# PyArrow (optional, "fast" extra) enables pandas' multithreaded CSV engine
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 
 class IntacctParser:
     """
@@ -38,20 +48,39 @@ class IntacctParser:
             config: Application configuration object
         """
         self.config = config
+
+        # Resolve file settings and column names once rather than on every parse
         input_config = config.input
         intacct_config = input_config.intacct if hasattr(input_config, "intacct") else {}
-        self.column_mappings = (
-            intacct_config.get("column_mappings", {})
-            if isinstance(intacct_config, dict)
-            else {}
-        )
-
-    def parse_file(self, file_path: Path) -> list[NormalizedTransaction]:
+        if not isinstance(intacct_config, dict):
+            intacct_config = {}
+        self.encoding: str = intacct_config.get("encoding", "utf-8")
+        self.delimiter: str = intacct_config.get("delimiter", ",")
+        self.date_format: str = intacct_config.get("date_format", "%m/%d/%Y")
+        self.column_mappings: dict[str, str] = intacct_config.get("column_mappings", {})
+        workers = intacct_config.get("parallel_workers", 1)
+        self.parallel_workers: int = workers or os.cpu_count() or 1
+        self.parallel_min_rows: int = intacct_config.get("parallel_min_rows", 100000)
+
+        mappings = self.column_mappings
+        self.date_col = mappings.get("date", "Date")
+        self.desc_col = mappings.get("description", "Description")
+        self.debit_col = mappings.get("debit", "Debit")
+        self.credit_col = mappings.get("credit", "Credit")
+        self.ref_col = mappings.get("reference", "Reference")
+        self.vendor_col = mappings.get("vendor", "Vendor")
+        self.gl_col = mappings.get("gl_account", "GL_Account")
+        self.txn_id_col = mappings.get("transaction_id", "Transaction_ID")
+
+    def parse_file(
+        self, file_path: Path, limit: Optional[int] = None
+    ) -> list[NormalizedTransaction]:
         """
         Parse a Sage Intacct CSV file and return normalized transactions.
 
         Args:
             file_path: Path to the CSV file
+            limit: Stop after this many transactions (optional, for previews)
 
         Returns:
             List of normalized transactions
@@ -61,122 +90,279 @@ class IntacctParser:
         """
         logger.info(f"Parsing Intacct CSV file: {file_path}")
 
-        try:
-            input_config = self.config.input
-            intacct_config = input_config.intacct if hasattr(input_config, "intacct") else {}
+        if limit is not None:
+            transactions = self._parse_preview(file_path, limit)
+        else:
+            try:
+                df = self._read_csv(file_path)
+            except Exception as e:
+                logger.error(f"Failed to read CSV file: {e}")
+                raise IntacctParseError(f"Failed to read CSV file: {e}") from e
+
+            transactions = self._process_rows(df)
 
-            if isinstance(intacct_config, dict):
-                encoding = intacct_config.get("encoding", "utf-8")
-                delimiter = intacct_config.get("delimiter", ",")
-            else:
-                encoding = "utf-8"
-                delimiter = ","
+        logger.info(f"Extracted {len(transactions)} transactions from Intacct CSV")
+
+        return transactions
+
+    def _parse_preview(self, file_path: Path, limit: int) -> list[NormalizedTransaction]:
+        """
+        Parse only as much of a CSV file as needed for the first transactions.
+
+        Rows are read in chunks until enough transactions exist, so rows that
+        are skipped (invalid date, no amount) do not count towards the limit.
+
+        Args:
+            file_path: Path to the CSV file
+            limit: Number of transactions to return at most
+
+        Returns:
+            List of up to limit normalized transactions
+
+        Raises:
+            IntacctParseError: If the file cannot be read
+        """
+        transactions: list[NormalizedTransaction] = []
 
-            df = pd.read_csv(
+        try:
+            # The PyArrow engine does not support chunked reads
+            with pd.read_csv(
                 file_path,
-                encoding=encoding,
-                delimiter=delimiter,
-            )
+                encoding=self.encoding,
+                delimiter=self.delimiter,
+                chunksize=max(limit, 1),
+            ) as reader:
+                for chunk in reader:
+                    transactions.extend(self._process_dataframe(chunk))
+                    if len(transactions) >= limit:
+                        break
         except Exception as e:
             logger.error(f"Failed to read CSV file: {e}")
             raise IntacctParseError(f"Failed to read CSV file: {e}") from e
 
-        transactions = self._process_dataframe(df)
-        logger.info(f"Extracted {len(transactions)} transactions from Intacct CSV")
+        return transactions[:limit]
 
-        return transactions
+    def _read_csv(self, file_path: Path) -> pd.DataFrame:
+        """
+        Read a CSV file, using the multithreaded PyArrow reader when available.
+
+        Files the PyArrow engine rejects are read with the default pandas engine.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Pandas DataFrame containing CSV data
+        """
+        if _HAS_PYARROW:
+            try:
+                return pd.read_csv(
+                    file_path,
+                    encoding=self.encoding,
+                    delimiter=self.delimiter,
+                    engine="pyarrow",
+                )
+            except Exception as e:
+                logger.debug(f"PyArrow CSV reader failed, using pandas reader: {e}")
+
+        return pd.read_csv(
+            file_path,
+            encoding=self.encoding,
+            delimiter=self.delimiter,
+        )
+
+    def _process_rows(self, df: pd.DataFrame) -> list[NormalizedTransaction]:
+        """
+        Convert CSV rows to transactions, splitting large files across processes.
+
+        Each worker processes a contiguous slice of rows, so the concatenated
+        result keeps file order and row-number based IDs.
+
+        Args:
+            df: Pandas DataFrame containing CSV data
+
+        Returns:
+            List of normalized transactions
+        """
+        workers = self.parallel_workers
+        if workers <= 1 or len(df) < self.parallel_min_rows:
+            return self._process_dataframe(df)
+
+        chunk_size = -(-len(df) // workers)
+        chunks = [df.iloc[start : start + chunk_size] for start in range(0, len(df), chunk_size)]
+        logger.debug(f"Processing {len(df)} CSV rows in {len(chunks)} worker processes")
+
+        initializer, initargs = worker_logging_initializer()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=initializer, initargs=initargs
+        ) as executor:
+            return list(
+                itertools.chain.from_iterable(executor.map(self._process_dataframe, chunks))
+            )
 
     def _process_dataframe(self, df: pd.DataFrame) -> list[NormalizedTransaction]:
         """
         Process the DataFrame and convert rows to normalized transactions.
 
+        Columns are parsed whole, then zipped row-wise to build transactions.
+
         Args:
             df: Pandas DataFrame containing CSV data
 
         Returns:
             List of normalized transactions
         """
+        date_col = self.date_col
+        debit_col = self.debit_col
+        credit_col = self.credit_col
+
+        row_count = len(df)
+        missing: list[None] = [None] * row_count
+
+        dates = self._parse_dates(df[date_col]) if date_col in df.columns else missing
+        debits = df[debit_col].tolist() if debit_col in df.columns else missing
+        credits = df[credit_col].tolist() if credit_col in df.columns else missing
+        descriptions = self._column_strings(df, self.desc_col)
+        references = self._column_strings(df, self.ref_col)
+        vendors = self._column_strings(df, self.vendor_col)
+        gl_accounts = self._column_strings(df, self.gl_col)
+        intacct_txn_ids = self._column_strings(df, self.txn_id_col)
+        records = self._row_dicts(df)
+
         transactions: list[NormalizedTransaction] = []
 
-        for idx, row in df.iterrows():
+        for (
+            idx,
+            txn_date,
+            debit,
+            credit,
+            description,
+            reference,
+            vendor,
+            gl_account,
+            intacct_txn_id,
+            record,
+        ) in zip(
+            df.index,
+            dates,
+            debits,
+            credits,
+            descriptions,
+            references,
+            vendors,
+            gl_accounts,
+            intacct_txn_ids,
+            records,
+            strict=True,
+        ):
             try:
-                txn = self._normalize_row(row, int(idx))
-                if txn:
-                    transactions.append(txn)
+                if not txn_date:
+                    logger.warning(f"Row {idx}: Invalid date, skipping")
+                    continue
+
+                # Parse amount and determine type
+                debit_val = self._parse_amount(debit)
+                credit_val = self._parse_amount(credit)
+
+                if debit_val and debit_val > 0:
+                    amount = debit_val
+                    txn_type = TransactionType.DEBIT
+                elif credit_val and credit_val > 0:
+                    amount = credit_val
+                    txn_type = TransactionType.CREDIT
+                else:
+                    logger.warning(f"Row {idx}: No valid amount found, skipping")
+                    continue
+
+                transactions.append(
+                    NormalizedTransaction(
+                        # Generate unique ID
+                        id=intacct_txn_id or f"INTACCT-{int(idx):05d}",
+                        source=TransactionSource.INTACCT,
+                        date=txn_date,
+                        amount=amount,
+                        type=txn_type,
+                        reference=reference,
+                        description=description if description is not None else "",
+                        vendor=vendor,
+                        gl_account=gl_account,
+                        intacct_transaction_id=intacct_txn_id,
+                        raw_data=record,
+                    )
+                )
             except Exception as e:
                 logger.warning(f"Failed to process row {idx}: {e}")
                 continue
 
         return transactions
 
-    def _normalize_row(
-        self, row: pd.Series, idx: int
-    ) -> Optional[NormalizedTransaction]:
+    def _parse_dates(self, dates: pd.Series) -> list[Optional[date]]:
         """
-        Convert a DataFrame row to a NormalizedTransaction.
+        Parse a column of date values from the CSV.
+
+        Text columns are parsed in one vectorized pass with the configured
+        format; values it rejects fall back to _parse_date().
 
         Args:
-            row: Pandas Series representing a row
-            idx: Row index
+            dates: Date column
 
         Returns:
-            Normalized transaction or None if row is invalid
+            List of Python date objects or None, one per row
         """
-        # Get column names from config
-        date_col = self.column_mappings.get("date", "Date")
-        desc_col = self.column_mappings.get("description", "Description")
-        debit_col = self.column_mappings.get("debit", "Debit")
-        credit_col = self.column_mappings.get("credit", "Credit")
-        ref_col = self.column_mappings.get("reference", "Reference")
-        vendor_col = self.column_mappings.get("vendor", "Vendor")
-        gl_col = self.column_mappings.get("gl_account", "GL_Account")
-        txn_id_col = self.column_mappings.get("transaction_id", "Transaction_ID")
-
-        # Parse date
-        txn_date = self._parse_date(row.get(date_col))
-        if not txn_date:
-            logger.warning(f"Row {idx}: Invalid date, skipping")
-            return None
+        values = dates.tolist()
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            # Already parsed by the CSV reader (PyArrow infers ISO dates)
+            return [None if pd.isna(value) else value.date() for value in values]
+        if not pd.api.types.is_string_dtype(dates):
+            return [self._parse_date(value) for value in values]
+
+        parsed = pd.to_datetime(dates, format=self.date_format, errors="coerce")
+        return [
+            self._parse_date(value) if pd.isna(timestamp) else timestamp.date()
+            for timestamp, value in zip(parsed.tolist(), values, strict=True)
+        ]
+
+    @staticmethod
+    def _column_strings(df: pd.DataFrame, column: str) -> list[Optional[str]]:
+        """
+        Extract a column as strings, with None for missing values.
 
-        # Parse amount and determine type
-        debit_val = self._parse_amount(row.get(debit_col))
-        credit_val = self._parse_amount(row.get(credit_col))
+        Args:
+            df: Pandas DataFrame containing CSV data
+            column: Column name
 
-        if debit_val and debit_val > 0:
-            amount = debit_val
-            txn_type = TransactionType.DEBIT
-        elif credit_val and credit_val > 0:
-            amount = credit_val
-            txn_type = TransactionType.CREDIT
-        else:
-            logger.warning(f"Row {idx}: No valid amount found, skipping")
-            return None
+        Returns:
+            List of string values or None, one per row
+        """
+        if column not in df.columns:
+            return [None] * len(df)
+
+        values = df[column]
+        present = values.notna().to_numpy()
+        strings = values.to_numpy(dtype=object)
+        if not pd.api.types.is_string_dtype(values):
+            # Coerce numeric IDs and accounts in one pass rather than per row
+            strings[present] = strings[present].astype(str)
+        strings[~present] = None
+        return cast(list[Optional[str]], strings.tolist())
+
+    @staticmethod
+    def _row_dicts(df: pd.DataFrame) -> list[dict[str, Any]]:
+        """
+        Build the raw column-to-value dict for each row.
 
-        # Extract other fields
-        description = str(row.get(desc_col, "")) if pd.notna(row.get(desc_col)) else ""
-        reference = str(row.get(ref_col, "")) if pd.notna(row.get(ref_col)) else None
-        vendor = str(row.get(vendor_col, "")) if pd.notna(row.get(vendor_col)) else None
-        gl_account = str(row.get(gl_col, "")) if pd.notna(row.get(gl_col)) else None
-        intacct_txn_id = (
-            str(row.get(txn_id_col, "")) if pd.notna(row.get(txn_id_col)) else None
-        )
+        Columns are converted to Python lists once and zipped row-wise, which
+        avoids the per-cell boxing done by DataFrame.to_dict("records").
 
-        # Generate unique ID
-        txn_id = intacct_txn_id or f"INTACCT-{idx:05d}"
-
-        return NormalizedTransaction(
-            id=txn_id,
-            source=TransactionSource.INTACCT,
-            date=txn_date,
-            amount=amount,
-            type=txn_type,
-            reference=reference,
-            description=description,
-            vendor=vendor,
-            gl_account=gl_account,
-            intacct_transaction_id=intacct_txn_id,
-            raw_data=row.to_dict(),
-        )
+        Args:
+            df: Pandas DataFrame containing CSV data
+
+        Returns:
+            List of row dictionaries, one per row
+        """
+        columns = list(df.columns)
+        values = [df[column].to_numpy(dtype=object).tolist() for column in columns]
+        return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
 
     def _parse_date(self, date_value) -> Optional[date]:
         """
@@ -194,16 +380,8 @@ class IntacctParser:
         if isinstance(date_value, (date, datetime)):
             return date_value if isinstance(date_value, date) else date_value.date()
 
-        input_config = self.config.input
-        intacct_config = input_config.intacct if hasattr(input_config, "intacct") else {}
-        date_format = (
-            intacct_config.get("date_format", "%m/%d/%Y")
-            if isinstance(intacct_config, dict)
-            else "%m/%d/%Y"
-        )
-
         try:
-            return datetime.strptime(str(date_value), date_format).date()
+            return parse_date(str(date_value), self.date_format)
         except ValueError:
             # Try pandas parser as fallback
             try:
@@ -221,18 +399,43 @@ class IntacctParser:
         Returns:
             Decimal amount or None
         """
-        if pd.isna(amount_value) or amount_value == "":
+        # Check the common cell types directly before the generic pd.isna()
+        if isinstance(amount_value, float):
+            if amount_value != amount_value:  # NaN marks an empty numeric cell
+                return None
+        elif isinstance(amount_value, str):
+            # Remove any currency symbols and commas
+            amount_value = amount_value.replace("$", "").replace(",", "").strip()
+            if not amount_value:
+                return None
+        elif pd.isna(amount_value):
             return None
 
         try:
-            # Remove any currency symbols and commas
-            if isinstance(amount_value, str):
-                amount_value = amount_value.replace("$", "").replace(",", "").strip()
-
             return Decimal(str(amount_value))
         except (InvalidOperation, ValueError):
             return None
 
+    @staticmethod
+    def _numeric_amounts(amounts: pd.Series) -> pd.Series:
+        """
+        Convert an amount column to floats in one vectorized pass.
+
+        Currency symbols and commas are removed as in _parse_amount(); values
+        that are not numbers become NaN.
+
+        Args:
+            amounts: Amount column
+
+        Returns:
+            Float amounts, NaN where missing or invalid
+        """
+        if pd.api.types.is_numeric_dtype(amounts):
+            return amounts.astype(float)
+
+        cleaned = amounts.str.replace(r"[$,]", "", regex=True).str.strip()
+        return pd.to_numeric(cleaned, errors="coerce")
+
     def get_file_summary(self, file_path: Path) -> dict:
         """
         Get summary information from a Sage Intacct CSV file.
@@ -243,30 +446,19 @@ class IntacctParser:
         Returns:
             Dictionary with file summary information
         """
-        input_config = self.config.input
-        intacct_config = input_config.intacct if hasattr(input_config, "intacct") else {}
-
-        if isinstance(intacct_config, dict):
-            encoding = intacct_config.get("encoding", "utf-8")
-            delimiter = intacct_config.get("delimiter", ",")
-        else:
-            encoding = "utf-8"
-            delimiter = ","
-
-        df = pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
+        df = self._read_csv(file_path)
 
-        # Get column names
-        date_col = self.column_mappings.get("date", "Date")
-        debit_col = self.column_mappings.get("debit", "Debit")
-        credit_col = self.column_mappings.get("credit", "Credit")
-        gl_col = self.column_mappings.get("gl_account", "GL_Account")
+        date_col = self.date_col
+        debit_col = self.debit_col
+        credit_col = self.credit_col
+        gl_col = self.gl_col
 
         # Parse dates for date range
-        dates = df[date_col].apply(self._parse_date).dropna()
+        dates = [d for d in self._parse_dates(df[date_col]) if d is not None]
 
         # Calculate totals
-        debits = df[debit_col].apply(self._parse_amount).dropna()
-        credits = df[credit_col].apply(self._parse_amount).dropna()
+        debits = self._numeric_amounts(df[debit_col]).dropna()
+        credits = self._numeric_amounts(df[credit_col]).dropna()
 
         summary = {
             "row_count": len(df),
@@ -278,8 +470,9 @@ class IntacctParser:
             "totals": {
                 "debit_count": len(debits),
                 "credit_count": len(credits),
-                "total_debits": float(sum(debits)) if len(debits) > 0 else 0,
-                "total_credits": float(sum(credits)) if len(credits) > 0 else 0,
+                # fsum avoids float drift when totalling many cent amounts
+                "total_debits": math.fsum(debits) if len(debits) > 0 else 0,
+                "total_credits": math.fsum(credits) if len(credits) > 0 else 0,
             },
             "gl_accounts": (
                 df[gl_col].dropna().unique().tolist() if gl_col in df.columns else []
@@ -3,40 +3,65 @@ Excel report generator for reconciliation results.
 Creates multi-sheet workbooks with formatted output.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from itertools import zip_longest
 from pathlib import Path
+from typing import Any, Sequence
 import logging
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.worksheet.worksheet import Worksheet
-
 from ..models.transaction import (
     NormalizedTransaction,
     MatchResult,
     ReconciliationSummary,
 )
 from ..config import ReconConfig
+from .sheet_writers import SheetWriter, WorkbookWriter, open_workbook
 
 logger = logging.getLogger(__name__)
 
-# Style definitions
-HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-HEADER_FONT = Font(color="FFFFFF", bold=True)
-MATCH_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-VARIANCE_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-UNMATCHED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-THIN_BORDER = Border(
-    left=Side(style="thin"),
-    right=Side(style="thin"),
-    top=Side(style="thin"),
-    bottom=Side(style="thin"),
-)
+# Report sheets in workbook order, with their default names
+DEFAULT_SHEET_NAMES = {
+    "summary": "Summary",
+    "matched": "Matched Transactions",
+    "bank_only": "Bank Only",
+    "intacct_only": "Intacct Only",
+    "amount_variances": "Amount Variances",
+    "audit_trail": "Audit Trail",
+}
+
+# Matched-sheet row styles by (exact match, amount variance); variances
+# highlight the Amount Variance and Date Variance columns
+_MATCHED_ROW_STYLES = {
+    (True, False): ["match"] * 13,
+    (False, False): ["data"] * 13,
+    (True, True): ["match"] * 11 + ["variance", "variance"],
+    (False, True): ["data"] * 11 + ["variance", "variance"],
+}
+
+# Sheets whose rows are built from the match results
+_MATCH_SHEETS = frozenset({"matched", "amount_variances", "audit_trail"})
+
+
+@dataclass
+class _MatchSheetRows:
+    """Row values for the sheets built from match results."""
+
+    matched: list[list[Any]] = field(default_factory=list)
+    matched_styles: list[list[str]] = field(default_factory=list)
+    variances: list[list[Any]] = field(default_factory=list)
+    audit_log: list[list[Any]] = field(default_factory=list)
 
 
 class ExcelReportGenerator:
-    """Generates Excel reconciliation reports with multiple sheets."""
+    """
+    Generates Excel reconciliation reports with multiple sheets.
+
+    Rows are streamed to disk as they are appended (openpyxl write-only mode,
+    or xlsxwriter when configured), so column widths are set before each
+    sheet's first row is written.
+    """
 
     def __init__(self, config: ReconConfig):
         """
@@ -49,6 +74,17 @@ class ExcelReportGenerator:
         output_config = config.output
         self.output_config = output_config.excel if hasattr(output_config, "excel") else {}
         self.sheet_config = output_config.sheets if hasattr(output_config, "sheets") else {}
+        self.engine: str = getattr(self.output_config, "engine", "openpyxl")
+
+        # Resolve sheet names and enabled flags once rather than per sheet
+        self._sheet_names: dict[str, str] = {}
+        enabled_sheets = set()
+        for key, default_name in DEFAULT_SHEET_NAMES.items():
+            sheet_config = getattr(self.sheet_config, key, None)
+            self._sheet_names[key] = sheet_config.name if sheet_config else default_name
+            if sheet_config is None or sheet_config.enabled:
+                enabled_sheets.add(key)
+        self._enabled_sheets = frozenset(enabled_sheets)
 
     def generate_report(
         self,
@@ -73,70 +109,66 @@ class ExcelReportGenerator:
         """
         logger.info(f"Generating Excel report: {output_path}")
 
-        wb = Workbook()
-
-        # Remove default sheet
-        if wb.active:
-            wb.remove(wb.active)
+        wb = open_workbook(self.engine, output_path)
 
         # Generate each sheet based on config
-        summary_config = getattr(self.sheet_config, "summary", None)
-        if summary_config is None or summary_config.enabled:
+        if "summary" in self._enabled_sheets:
             self._create_summary_sheet(wb, summary)
 
-        matched_config = getattr(self.sheet_config, "matched", None)
-        if matched_config is None or matched_config.enabled:
-            self._create_matched_sheet(wb, matches)
+        # Rows for the matched, variance and audit sheets come from one pass,
+        # skipped entirely when none of those sheets is enabled
+        match_sheets = self._enabled_sheets & _MATCH_SHEETS
+        if match_sheets:
+            match_rows = self._build_match_rows(matches, match_sheets)
+        else:
+            match_rows = _MatchSheetRows()
+
+        if "matched" in self._enabled_sheets:
+            self._create_matched_sheet(wb, match_rows)
 
-        bank_only_config = getattr(self.sheet_config, "bank_only", None)
-        if bank_only_config is None or bank_only_config.enabled:
+        if "bank_only" in self._enabled_sheets:
             self._create_bank_only_sheet(wb, bank_only)
 
-        intacct_only_config = getattr(self.sheet_config, "intacct_only", None)
-        if intacct_only_config is None or intacct_only_config.enabled:
+        if "intacct_only" in self._enabled_sheets:
             self._create_intacct_only_sheet(wb, intacct_only)
 
-        variances_config = getattr(self.sheet_config, "amount_variances", None)
-        if variances_config is None or variances_config.enabled:
-            variance_matches = [m for m in matches if m.amount_variance]
-            self._create_variance_sheet(wb, variance_matches)
+        if "amount_variances" in self._enabled_sheets:
+            self._create_variance_sheet(wb, match_rows.variances)
 
-        audit_config = getattr(self.sheet_config, "audit_trail", None)
-        if audit_config is None or audit_config.enabled:
-            self._create_audit_trail_sheet(wb, summary, matches)
+        if "audit_trail" in self._enabled_sheets:
+            self._create_audit_trail_sheet(wb, summary, match_rows.audit_log)
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save workbook
-        wb.save(output_path)
+        wb.save()
         logger.info(f"Report saved: {output_path}")
 
         return output_path
 
     def _create_summary_sheet(
-        self, wb: Workbook, summary: ReconciliationSummary
+        self, wb: WorkbookWriter, summary: ReconciliationSummary
     ) -> None:
         """Create the summary sheet with key metrics."""
-        summary_config = getattr(self.sheet_config, "summary", None)
-        sheet_name = summary_config.name if summary_config else "Summary"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["summary"])
+
+        # Widths must be set before the first row is streamed
+        ws.set_column_widths({1: 30, 2: 40})
 
         # Title
-        ws["A1"] = "Bank Reconciliation Summary"
-        ws["A1"].font = Font(size=16, bold=True)
-        ws.merge_cells("A1:D1")
+        ws.append_merged("Bank Reconciliation Summary", "title", columns=4)
+        ws.append([])
 
         # File information section
-        ws["A3"] = "File Information"
-        ws["A3"].font = Font(bold=True)
+        ws.append(["File Information"], ["section"])
 
         file_info = [
             ("BAI2 File:", summary.bai2_filename),
             ("Intacct File:", summary.intacct_filename),
             (
                 "Reconciliation Date:",
-                summary.reconciliation_date.strftime("%Y-%m-%d %H:%M:%S"),
+                summary.reconciliation_date.isoformat(sep=" ", timespec="seconds"),
             ),
             (
                 "Statement Period:",
@@ -144,13 +176,12 @@ class ExcelReportGenerator:
             ),
         ]
 
-        for i, (label, value) in enumerate(file_info, start=4):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = str(value)
+        for label, value in file_info:
+            ws.append([label, str(value)])
+        ws.append([])
 
         # Transaction counts section
-        ws["A9"] = "Transaction Counts"
-        ws["A9"].font = Font(bold=True)
+        ws.append(["Transaction Counts"], ["section"])
 
         count_data = [
             ("Total Bank Transactions:", summary.total_bank_transactions),
@@ -161,22 +192,18 @@ class ExcelReportGenerator:
             ("Amount Variances:", summary.variance_count),
         ]
 
-        for i, (label, value) in enumerate(count_data, start=10):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = value
+        for label, value in count_data:
+            ws.append([label, value])
+        ws.append([])
 
         # Match rates
-        ws["A17"] = "Match Rates"
-        ws["A17"].font = Font(bold=True)
-
-        ws["A18"] = "Bank Match Rate:"
-        ws["B18"] = f"{summary.match_rate_bank:.1f}%"
-        ws["A19"] = "Intacct Match Rate:"
-        ws["B19"] = f"{summary.match_rate_intacct:.1f}%"
+        ws.append(["Match Rates"], ["section"])
+        ws.append(["Bank Match Rate:", f"{summary.match_rate_bank:.1f}%"])
+        ws.append(["Intacct Match Rate:", f"{summary.match_rate_intacct:.1f}%"])
+        ws.append([])
 
         # Amount totals
-        ws["A21"] = "Amount Totals"
-        ws["A21"].font = Font(bold=True)
+        ws.append(["Amount Totals"], ["section"])
 
         amount_data = [
             ("Bank Total Credits:", f"${summary.bank_total_credits:,.2f}"),
@@ -186,29 +213,19 @@ class ExcelReportGenerator:
             ("Total Amount Variance:", f"${summary.total_amount_variance:,.2f}"),
         ]
 
-        for i, (label, value) in enumerate(amount_data, start=22):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = value
+        for label, value in amount_data:
+            ws.append([label, value])
+        ws.append([])
 
         # Matches by tier
-        ws["A28"] = "Matches by Tier"
-        ws["A28"].font = Font(bold=True)
+        ws.append(["Matches by Tier"], ["section"])
 
-        row = 29
         for tier, count in summary.matches_by_tier.items():
-            ws[f"A{row}"] = tier
-            ws[f"B{row}"] = count
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 40
+            ws.append([tier, count])
 
-    def _create_matched_sheet(self, wb: Workbook, matches: list[MatchResult]) -> None:
+    def _create_matched_sheet(self, wb: WorkbookWriter, match_rows: _MatchSheetRows) -> None:
         """Create the matched transactions sheet."""
-        matched_config = getattr(self.sheet_config, "matched", None)
-        sheet_name = matched_config.name if matched_config else "Matched Transactions"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["matched"])
 
         headers = [
             "Bank Date",
@@ -226,56 +243,19 @@ class ExcelReportGenerator:
             "Date Variance (Days)",
         ]
 
-        # Write headers
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = THIN_BORDER
-
-        # Write data
-        for row_num, match in enumerate(matches, start=2):
-            bank_txn = match.bank_transaction
-            intacct_txn = (
-                match.intacct_transactions[0] if match.intacct_transactions else None
-            )
-
-            row_data = [
-                bank_txn.date,
-                bank_txn.reference or "",
-                float(bank_txn.amount),
-                bank_txn.description,
-                intacct_txn.date if intacct_txn else "",
-                intacct_txn.reference if intacct_txn else "",
-                float(intacct_txn.amount) if intacct_txn else "",
-                intacct_txn.description if intacct_txn else "",
-                match.match_tier,
-                f"{match.match_score:.2f}",
-                match.match_reason,
-                float(match.amount_variance) if match.amount_variance else "",
-                match.date_variance_days if match.date_variance_days else "",
-            ]
-
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = THIN_BORDER
-
-                # Highlight variances
-                if match.amount_variance and col in [12, 13]:
-                    cell.fill = VARIANCE_FILL
-                elif match.is_exact_match:
-                    cell.fill = MATCH_FILL
-
         # Auto-fit columns
-        self._auto_fit_columns(ws)
+        self._fit_columns(ws, [headers, *match_rows.matched])
+        ws.append(headers, ["header"] * len(headers))
+
+        append = ws.append
+        for row_data, row_style in zip(match_rows.matched, match_rows.matched_styles, strict=True):
+            append(row_data, row_style)
 
     def _create_bank_only_sheet(
-        self, wb: Workbook, bank_only: list[NormalizedTransaction]
+        self, wb: WorkbookWriter, bank_only: list[NormalizedTransaction]
     ) -> None:
         """Create the bank-only transactions sheet."""
-        bank_only_config = getattr(self.sheet_config, "bank_only", None)
-        sheet_name = bank_only_config.name if bank_only_config else "Bank Only"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["bank_only"])
 
         headers = [
             "Date",
@@ -287,16 +267,9 @@ class ExcelReportGenerator:
             "BAI2 Type Description",
         ]
 
-        # Write headers
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = THIN_BORDER
-
         # Write data
-        for row_num, txn in enumerate(bank_only, start=2):
-            row_data = [
+        rows = [
+            [
                 txn.date,
                 txn.reference or "",
                 float(txn.amount),
@@ -305,21 +278,16 @@ class ExcelReportGenerator:
                 txn.bai2_type_code or "",
                 txn.bai2_type_description or "",
             ]
+            for txn in bank_only
+        ]
 
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = THIN_BORDER
-                cell.fill = UNMATCHED_FILL
-
-        self._auto_fit_columns(ws)
+        self._write_table(ws, headers, rows, "unmatched")
 
     def _create_intacct_only_sheet(
-        self, wb: Workbook, intacct_only: list[NormalizedTransaction]
+        self, wb: WorkbookWriter, intacct_only: list[NormalizedTransaction]
     ) -> None:
         """Create the Intacct-only transactions sheet."""
-        intacct_only_config = getattr(self.sheet_config, "intacct_only", None)
-        sheet_name = intacct_only_config.name if intacct_only_config else "Intacct Only"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["intacct_only"])
 
         headers = [
             "Date",
@@ -332,16 +300,9 @@ class ExcelReportGenerator:
             "Transaction ID",
         ]
 
-        # Write headers
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = THIN_BORDER
-
         # Write data
-        for row_num, txn in enumerate(intacct_only, start=2):
-            row_data = [
+        rows = [
+            [
                 txn.date,
                 txn.reference or "",
                 float(txn.amount),
@@ -351,21 +312,14 @@ class ExcelReportGenerator:
                 txn.gl_account or "",
                 txn.intacct_transaction_id or "",
             ]
+            for txn in intacct_only
+        ]
 
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = THIN_BORDER
-                cell.fill = UNMATCHED_FILL
-
-        self._auto_fit_columns(ws)
+        self._write_table(ws, headers, rows, "unmatched")
 
-    def _create_variance_sheet(
-        self, wb: Workbook, variance_matches: list[MatchResult]
-    ) -> None:
+    def _create_variance_sheet(self, wb: WorkbookWriter, rows: list[list[Any]]) -> None:
         """Create the amount variances sheet."""
-        variances_config = getattr(self.sheet_config, "amount_variances", None)
-        sheet_name = variances_config.name if variances_config else "Amount Variances"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["amount_variances"])
 
         headers = [
             "Reference",
@@ -378,117 +332,161 @@ class ExcelReportGenerator:
             "Match Tier",
         ]
 
-        # Write headers
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = THIN_BORDER
-
-        # Write data
-        for row_num, match in enumerate(variance_matches, start=2):
-            bank_txn = match.bank_transaction
-            intacct_txn = (
-                match.intacct_transactions[0] if match.intacct_transactions else None
-            )
-
-            variance_pct = ""
-            if bank_txn.amount and match.amount_variance:
-                variance_pct = f"{(match.amount_variance / bank_txn.amount) * 100:.2f}%"
-
-            row_data = [
-                bank_txn.reference or "",
-                bank_txn.date,
-                float(bank_txn.amount),
-                intacct_txn.date if intacct_txn else "",
-                float(intacct_txn.amount) if intacct_txn else "",
-                float(match.amount_variance) if match.amount_variance else "",
-                variance_pct,
-                match.match_tier,
-            ]
-
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = THIN_BORDER
-                cell.fill = VARIANCE_FILL
-
-        self._auto_fit_columns(ws)
+        self._write_table(ws, headers, rows, "variance")
 
     def _create_audit_trail_sheet(
-        self, wb: Workbook, summary: ReconciliationSummary, matches: list[MatchResult]
+        self, wb: WorkbookWriter, summary: ReconciliationSummary, log_rows: list[list[Any]]
     ) -> None:
         """Create the audit trail sheet."""
-        audit_config = getattr(self.sheet_config, "audit_trail", None)
-        sheet_name = audit_config.name if audit_config else "Audit Trail"
-        ws = wb.create_sheet(sheet_name)
+        ws = wb.add_sheet(self._sheet_names["audit_trail"])
 
         # Reconciliation metadata
-        ws["A1"] = "Reconciliation Audit Trail"
-        ws["A1"].font = Font(size=14, bold=True)
-
+        title = "Reconciliation Audit Trail"
         audit_info = [
-            ("Generated At:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ("Generated At:", datetime.now().isoformat(sep=" ", timespec="seconds")),
             ("Config File:", summary.config_file_used or "Default"),
             ("Processing Time:", f"{summary.processing_time_seconds:.2f} seconds"),
             ("", ""),
             ("Match Statistics:", ""),
         ]
 
-        row = 3
-        for label, value in audit_info:
-            ws[f"A{row}"] = label
-            ws[f"B{row}"] = value
-            row += 1
-
         # Match details by tier
-        for tier, count in summary.matches_by_tier.items():
-            ws[f"A{row}"] = f"  {tier}:"
-            ws[f"B{row}"] = count
-            row += 1
-
-        row += 1
-        ws[f"A{row}"] = "Match Log"
-        ws[f"A{row}"].font = Font(bold=True)
-        row += 1
+        tier_info = [(f"  {tier}:", count) for tier, count in summary.matches_by_tier.items()]
 
         # Headers for match log
         headers = ["Timestamp", "Bank ID", "Intacct ID", "Tier", "Score", "Reason"]
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-        row += 1
 
-        # Match log entries
-        for match in matches:
-            intacct_ids = ", ".join(t.id for t in match.intacct_transactions)
-            log_data = [
-                match.matched_at.strftime("%Y-%m-%d %H:%M:%S"),
-                match.bank_transaction.id,
-                intacct_ids,
-                match.match_tier,
-                f"{match.match_score:.2f}",
-                match.match_reason,
-            ]
+        self._fit_columns(ws, [[title], *audit_info, *tier_info, ["Match Log"], headers, *log_rows])
+
+        ws.append([title], ["subtitle"])
+        ws.append([])
+        for row in audit_info + tier_info:
+            ws.append(row)
+        ws.append([])
+        ws.append(["Match Log"], ["section"])
+        ws.append(headers, ["header_plain"] * len(headers))
+        append = ws.append
+        for log_row in log_rows:
+            append(log_row)
+
+    def _build_match_rows(
+        self, matches: list[MatchResult], sheets: frozenset[str] = _MATCH_SHEETS
+    ) -> _MatchSheetRows:
+        """
+        Build the matched, amount variance and audit log rows in one pass.
 
-            for col, value in enumerate(log_data, start=1):
-                ws.cell(row=row, column=col, value=value)
-            row += 1
+        Values shared between sheets (amounts, score text) are converted once
+        per match.
 
-        self._auto_fit_columns(ws)
+        Args:
+            matches: List of match results
+            sheets: Match-based sheets to build rows for; the rest stay empty
 
-    def _auto_fit_columns(self, ws: Worksheet) -> None:
-        """Auto-fit column widths based on content."""
-        for column_cells in ws.columns:
-            max_length = 0
-            column = column_cells[0].column_letter
+        Returns:
+            Row values for each match-based sheet
+        """
+        rows = _MatchSheetRows()
+        build_matched = "matched" in sheets
+        build_variances = "amount_variances" in sheets
+        build_audit_log = "audit_trail" in sheets
 
-            for cell in column_cells:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except Exception:
-                    pass
+        # Bound methods hoisted out of the per-match loop
+        matched_append = rows.matched.append
+        matched_styles_append = rows.matched_styles.append
+        variances_append = rows.variances.append
+        audit_log_append = rows.audit_log.append
 
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
+        for match in matches:
+            bank_txn = match.bank_transaction
+            intacct_txns = match.intacct_transactions
+            intacct_txn = intacct_txns[0] if intacct_txns else None
+            amount_variance = match.amount_variance
+            date_variance_days = match.date_variance_days
+
+            bank_amount = float(bank_txn.amount)
+            intacct_date = intacct_txn.date if intacct_txn else ""
+            intacct_amount = float(intacct_txn.amount) if intacct_txn else ""
+            variance = float(amount_variance) if amount_variance else ""
+            score = f"{match.match_score:.2f}"
+
+            if build_matched:
+                matched_append(
+                    [
+                        bank_txn.date,
+                        bank_txn.reference or "",
+                        bank_amount,
+                        bank_txn.description,
+                        intacct_date,
+                        intacct_txn.reference if intacct_txn else "",
+                        intacct_amount,
+                        intacct_txn.description if intacct_txn else "",
+                        match.match_tier,
+                        score,
+                        match.match_reason,
+                        variance,
+                        date_variance_days if date_variance_days else "",
+                    ]
+                )
+                matched_styles_append(
+                    _MATCHED_ROW_STYLES[match.is_exact_match, bool(amount_variance)]
+                )
+
+            if build_variances and amount_variance:
+                variance_pct = ""
+                if bank_txn.amount:
+                    variance_pct = f"{(amount_variance / bank_txn.amount) * 100:.2f}%"
+
+                variances_append(
+                    [
+                        bank_txn.reference or "",
+                        bank_txn.date,
+                        bank_amount,
+                        intacct_date,
+                        intacct_amount,
+                        variance,
+                        variance_pct,
+                        match.match_tier,
+                    ]
+                )
+
+            if build_audit_log:
+                audit_log_append(
+                    [
+                        match.matched_at.isoformat(sep=" ", timespec="seconds"),
+                        bank_txn.id,
+                        ", ".join(t.id for t in intacct_txns),
+                        match.match_tier,
+                        score,
+                        match.match_reason,
+                    ]
+                )
+
+        return rows
+
+    def _write_table(
+        self, ws: SheetWriter, headers: list[str], rows: list[list[Any]], style: str
+    ) -> None:
+        """Write a header row and data rows that all share one cell style."""
+        self._fit_columns(ws, [headers, *rows])
+        ws.append(headers, ["header"] * len(headers))
+        row_styles = [style] * len(headers)
+        append = ws.append
+        for row_data in rows:
+            append(row_data, row_styles)
+
+    def _fit_columns(self, ws: SheetWriter, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Size columns to their longest value before any rows are written.
+
+        Args:
+            ws: Worksheet that has not had rows appended yet
+            rows: Every row the sheet will contain, as plain values
+        """
+        # Scan column by column so the length checks run in map/max rather than
+        # per value in Python; short rows are padded with None (ignored)
+        ws.set_column_widths(
+            {
+                col: min(max(map(len, map(str, filter(None, values))), default=0) + 2, 50)
+                for col, values in enumerate(zip_longest(*rows), start=1)
+            }
+        )
@@ -0,0 +1,311 @@
+"""
+Streaming worksheet writers for the Excel report backends.
+
+Both backends write rows strictly in order, so column widths must be set
+before a sheet's first row is appended.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from copy import copy
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Font, PatternFill, Side
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.xml import LXML
+
+# xlsxwriter (optional, "fast" extra) writes large reports roughly twice as fast
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+from ..utils.exceptions import ReportGenerationError
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("openpyxl", "xlsxwriter")
+
+# Style definitions
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(color="FFFFFF", bold=True)
+MATCH_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+VARIANCE_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+UNMATCHED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+THIN_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+
+# Named cell styles used by the report: (font, fill, border) for openpyxl
+CELL_STYLES: dict[str, tuple[Optional[Font], Optional[PatternFill], Optional[Border]]] = {
+    "title": (Font(size=16, bold=True), None, None),
+    "subtitle": (Font(size=14, bold=True), None, None),
+    "section": (Font(bold=True), None, None),
+    "header": (HEADER_FONT, HEADER_FILL, THIN_BORDER),
+    "header_plain": (HEADER_FONT, HEADER_FILL, None),
+    "data": (None, None, THIN_BORDER),
+    "match": (None, MATCH_FILL, THIN_BORDER),
+    "variance": (None, VARIANCE_FILL, THIN_BORDER),
+    "unmatched": (None, UNMATCHED_FILL, THIN_BORDER),
+}
+
+# The same styles as xlsxwriter format properties
+_XLSXWRITER_FORMATS: dict[str, dict[str, Any]] = {
+    "title": {"font_size": 16, "bold": True},
+    "subtitle": {"font_size": 14, "bold": True},
+    "section": {"bold": True},
+    "header": {"font_color": "#FFFFFF", "bold": True, "bg_color": "#4472C4", "border": 1},
+    "header_plain": {"font_color": "#FFFFFF", "bold": True, "bg_color": "#4472C4"},
+    "data": {"border": 1},
+    "match": {"bg_color": "#C6EFCE", "border": 1},
+    "variance": {"bg_color": "#FFEB9C", "border": 1},
+    "unmatched": {"bg_color": "#FFC7CE", "border": 1},
+}
+
+# Number format for date cells, matching openpyxl's default for dates
+DATE_FORMAT = "yyyy-mm-dd"
+
+
+class SheetWriter(ABC):
+    """Streams rows to one worksheet."""
+
+    @abstractmethod
+    def set_column_widths(self, widths: dict[int, float]) -> None:
+        """
+        Set column widths; must be called before the first row is appended.
+
+        Args:
+            widths: Width by 1-based column index
+        """
+
+    @abstractmethod
+    def append(
+        self, values: Sequence[Any], styles: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        """
+        Append a row.
+
+        Args:
+            values: Cell values
+            styles: CELL_STYLES name per cell, or None for unstyled cells
+        """
+
+    @abstractmethod
+    def append_merged(self, value: Any, style: str, columns: int) -> None:
+        """
+        Append a row holding one value merged across the first columns.
+
+        Args:
+            value: Cell value
+            style: CELL_STYLES name
+            columns: Number of columns to merge
+        """
+
+
+class WorkbookWriter(ABC):
+    """Creates worksheets and saves the finished workbook."""
+
+    @abstractmethod
+    def add_sheet(self, name: str) -> SheetWriter:
+        """Add a worksheet and return its writer."""
+
+    @abstractmethod
+    def save(self) -> None:
+        """Write the workbook to its output path."""
+
+
+class _OpenpyxlSheetWriter(SheetWriter):
+    """Sheet writer backed by an openpyxl write-only worksheet."""
+
+    def __init__(self, ws: WriteOnlyWorksheet):
+        self.ws = ws
+        self.row_count = 0
+        # Style indices per CELL_STYLES name, resolved once from a template cell
+        self._style_arrays: dict[str, StyleArray] = {}
+
+    def set_column_widths(self, widths: dict[int, float]) -> None:
+        for col, width in widths.items():
+            self.ws.column_dimensions[get_column_letter(col)].width = width
+
+    def append(
+        self, values: Sequence[Any], styles: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        if styles is None:
+            self.ws.append(values)
+        else:
+            styled_cell = self._styled_cell
+            self.ws.append(
+                [styled_cell(value, style) for value, style in zip(values, styles, strict=True)]
+            )
+        self.row_count += 1
+
+    def append_merged(self, value: Any, style: str, columns: int) -> None:
+        row = self.row_count + 1
+        self.ws.merged_cells.add(f"A{row}:{get_column_letter(columns)}{row}")
+        self.append([value], [style])
+
+    def _styled_cell(self, value: Any, style: Optional[str]) -> Any:
+        """
+        Wrap a value in a WriteOnlyCell carrying the named style.
+
+        Assigning font/fill/border hashes each style object against the
+        workbook's style tables, so that is done once per style on a template
+        cell and later cells copy its style indices.
+        """
+        if style is None:
+            return value
+
+        style_array = self._style_arrays.get(style)
+        if style_array is None:
+            template = WriteOnlyCell(self.ws)
+            font, fill, border = CELL_STYLES[style]
+            if font is not None:
+                template.font = font
+            if fill is not None:
+                template.fill = fill
+            if border is not None:
+                template.border = border
+            style_array = self._style_arrays[style] = template._style
+
+        cell = WriteOnlyCell(self.ws)
+        # Copy before binding the value: dates set their own number format
+        cell._style = copy(style_array)
+        cell.value = value
+        return cell
+
+
+class _OpenpyxlWorkbookWriter(WorkbookWriter):
+    """Workbook writer using openpyxl's write-only mode."""
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        # Write-only workbooks start without a default sheet
+        self.wb = Workbook(write_only=True)
+        if not LXML:
+            # openpyxl streams rows through lxml (optional, "fast" extra) when present
+            logger.debug("lxml not available; openpyxl will use its slower pure-Python XML writer")
+
+    def add_sheet(self, name: str) -> SheetWriter:
+        return _OpenpyxlSheetWriter(self.wb.create_sheet(name))
+
+    def save(self) -> None:
+        self.wb.save(self.output_path)
+
+
+class _XlsxWriterSheetWriter(SheetWriter):
+    """Sheet writer backed by an xlsxwriter worksheet in constant-memory mode."""
+
+    def __init__(
+        self, ws: Any, formats: dict[Optional[str], Any], date_formats: dict[Optional[str], Any]
+    ):
+        self.ws = ws
+        self.formats = formats
+        self.date_formats = date_formats
+        self.row_count = 0
+
+    def set_column_widths(self, widths: dict[int, float]) -> None:
+        for col, width in widths.items():
+            self.ws.set_column(col - 1, col - 1, width)
+
+    def append(
+        self, values: Sequence[Any], styles: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        ws = self.ws
+        formats = self.formats
+        row = self.row_count
+        if styles is None:
+            styles = [None] * len(values)
+
+        # Dispatch on the value type here: the generic write() re-inspects each
+        # value and runs its string-conversion checks on every cell
+        for col, (value, style) in enumerate(zip(values, styles, strict=True)):
+            value_type = type(value)
+            if value_type is str:
+                if value:
+                    ws.write_string(row, col, value, formats.get(style))
+                else:
+                    ws.write_blank(row, col, None, formats.get(style))
+            elif value_type is float or value_type is int:
+                ws.write_number(row, col, value, formats.get(style))
+            elif isinstance(value, date):
+                # Cell formats replace the default date format, so dates need their own
+                ws.write_datetime(row, col, value, self.date_formats[style])
+            elif value is None:
+                ws.write_blank(row, col, None, formats.get(style))
+            else:
+                ws.write(row, col, value, formats.get(style))
+        self.row_count += 1
+
+    def append_merged(self, value: Any, style: str, columns: int) -> None:
+        row = self.row_count
+        self.ws.merge_range(row, 0, row, columns - 1, value, self.formats[style])
+        self.row_count += 1
+
+
+class _XlsxWriterWorkbookWriter(WorkbookWriter):
+    """Workbook writer using xlsxwriter, which flushes each row as it is written."""
+
+    def __init__(self, output_path: Path):
+        self.wb = xlsxwriter.Workbook(
+            str(output_path),
+            {
+                "constant_memory": True,
+                # Write report text verbatim, as openpyxl does
+                "strings_to_numbers": False,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "default_date_format": DATE_FORMAT,
+            },
+        )
+        self.formats: dict[Optional[str], Any] = {
+            name: self.wb.add_format(properties) for name, properties in _XLSXWRITER_FORMATS.items()
+        }
+        self.date_formats: dict[Optional[str], Any] = {
+            name: self.wb.add_format({**properties, "num_format": DATE_FORMAT})
+            for name, properties in _XLSXWRITER_FORMATS.items()
+        }
+        self.date_formats[None] = self.wb.add_format({"num_format": DATE_FORMAT})
+
+    def add_sheet(self, name: str) -> SheetWriter:
+        return _XlsxWriterSheetWriter(self.wb.add_worksheet(name), self.formats, self.date_formats)
+
+    def save(self) -> None:
+        self.wb.close()
+
+
+def open_workbook(engine: str, output_path: Path) -> WorkbookWriter:
+    """
+    Create a workbook writer for the configured engine.
+
+    Falls back to openpyxl when xlsxwriter is requested but not installed.
+
+    Args:
+        engine: "openpyxl" or "xlsxwriter"
+        output_path: Path the workbook will be saved to
+
+    Returns:
+        Workbook writer
+
+    Raises:
+        ReportGenerationError: If the engine is not recognized
+    """
+    if engine not in ENGINES:
+        raise ReportGenerationError(
+            f"Unknown Excel engine '{engine}'; expected one of: {', '.join(ENGINES)}"
+        )
+
+    if engine == "xlsxwriter":
+        if xlsxwriter is not None:
+            return _XlsxWriterWorkbookWriter(output_path)
+        logger.warning("xlsxwriter is not installed; writing the report with openpyxl")
+
+    return _OpenpyxlWorkbookWriter(output_path)
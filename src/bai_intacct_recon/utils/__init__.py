@@ -7,6 +7,7 @@ from .exceptions import (
     ConfigurationError,
     ReportGenerationError,
 )
+from .dates import parse_date
 from .logging_config import setup_logging
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "IntacctParseError",
     "ConfigurationError",
     "ReportGenerationError",
+    "parse_date",
     "setup_logging",
 ]
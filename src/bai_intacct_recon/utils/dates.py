@@ -0,0 +1,25 @@
+"""Date parsing helpers shared by the file parsers."""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str, date_format: str) -> date:
+    """
+    Parse a date string with a strptime format, memoizing results.
+
+    Statement and export files repeat the same few dates across many rows,
+    so most calls are cache hits.
+
+    Args:
+        date_str: Date string to parse
+        date_format: strptime format string
+
+    Returns:
+        Python date object
+
+    Raises:
+        ValueError: If the string does not match the format
+    """
+    return datetime.strptime(date_str, date_format).date()
@@ -1,9 +1,27 @@
 """Logging configuration for the reconciliation application."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import multiprocessing
+import multiprocessing.queues
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+
+# Formatters for the built-in formats, shared across setup_logging calls
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_FORMAT)
+_FILE_FORMATTER = logging.Formatter(FILE_FORMAT)
+
+# Background thread writing queued records to the log file
+_LISTENER: Optional[QueueListener] = None
+
+# Arguments for _init_worker_logging: (level, console format, log file queue)
+_WORKER_LOG_ARGS: Optional[
+    tuple[int, str, Optional["multiprocessing.queues.Queue[logging.LogRecord]"]]
+] = None
 
 
 def setup_logging(
@@ -14,6 +32,12 @@ def setup_logging(
     """
     Configure application logging.
 
+    File records are queued and written by a background listener thread, so
+    logging from hot loops does not block on file I/O. Console output stays
+    synchronous so it keeps its order relative to the CLI's own output.
+    Worker process pools should be created with worker_logging_initializer()
+    so their records reach the same handlers.
+
     Args:
         level: Logging level (e.g., logging.DEBUG, logging.INFO)
         log_file: Optional path to log file
@@ -22,42 +46,108 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    # Default format
-    if log_format is None:
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    global _LISTENER, _WORKER_LOG_ARGS
+
+    if log_format is None or log_format == DEFAULT_FORMAT:
+        log_format = DEFAULT_FORMAT
+        console_formatter = _DEFAULT_FORMATTER
+    else:
+        console_formatter = logging.Formatter(log_format)
+
+    # Skip collecting thread/process details for every record when no format shows them
+    formats = log_format + FILE_FORMAT
+    logging.logThreads = "%(thread" in formats
+    logging.logProcesses = "%(process)" in formats
+    logging.logMultiprocessing = "%(processName)" in formats
 
     # Root logger for the application
     logger = logging.getLogger("bai_intacct_recon")
     logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, flushing any queued records
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
     logger.handlers = []
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_formatter = logging.Formatter(log_format)
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
     # File handler (if configured)
+    log_queue: Optional["multiprocessing.queues.Queue[logging.LogRecord]"] = None
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
+            delay=True,  # Don't create the file until the first record
         )
         file_handler.setLevel(logging.DEBUG)  # Capture all levels in file
-        file_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        # A process-shared queue, so worker processes can log to it as well;
+        # records are pickled by the queue's feeder thread, not the caller
+        log_queue = multiprocessing.Queue()
+        logger.addHandler(QueueHandler(log_queue))
+        _LISTENER = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _LISTENER.start()
+
+    _WORKER_LOG_ARGS = (level, log_format, log_queue)
 
     return logger
 
 
+def worker_logging_initializer() -> tuple[Optional[Callable[..., None]], tuple[Any, ...]]:
+    """
+    Get the initializer for worker process pools.
+
+    Workers get their own console handler and send file records to the parent's
+    listener. Pass the result as a ProcessPoolExecutor's initializer and initargs.
+
+    Returns:
+        Tuple of (initializer, initargs); (None, ()) if setup_logging was not called
+    """
+    if _WORKER_LOG_ARGS is None:
+        return None, ()
+    return _init_worker_logging, _WORKER_LOG_ARGS
+
+
+def _init_worker_logging(
+    level: int,
+    log_format: str,
+    log_queue: Optional["multiprocessing.queues.Queue[logging.LogRecord]"],
+) -> None:
+    """Configure logging in a worker process (see worker_logging_initializer)."""
+    global _LISTENER
+
+    # A forked worker inherits the parent's listener object but not its thread
+    _LISTENER = None
+
+    logger = logging.getLogger("bai_intacct_recon")
+    logger.setLevel(level)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(level)
+    console_handler.setFormatter(logging.Formatter(log_format))
+    logger.handlers = [console_handler]
+
+    if log_queue is not None:
+        logger.addHandler(QueueHandler(log_queue))
+
+
+def _stop_listener() -> None:
+    """Flush queued records to the log file at interpreter exit."""
+    if _LISTENER is not None:
+        _LISTENER.stop()
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -0,0 +1,64 @@
+"""Tests for the BAI2 parser."""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from bai_intacct_recon.config import load_config
+from bai_intacct_recon.models.transaction import NormalizedTransaction
+from bai_intacct_recon.parsers.bai2_parser import BAI2Parser, _cents_to_dollars
+
+
+def parse_records(tmp_path: Path, *records: str) -> list[NormalizedTransaction]:
+    """Parse type 16 records wrapped in a minimal BAI2 file."""
+    lines = [
+        "01,FIRSTNATL,ACME_CORP,241130,0600,1,080,10,2/",
+        "02,ACME_CORP,021000021,1,241101,2400,,2/",
+        "03,123456789,USD,010,5000000,,,040,5000000,6/",
+        *records,
+        "49,5000000,6/",
+        "98,5000000,1,9/",
+        "99,5000000,1,11/",
+    ]
+    bai2_file = tmp_path / "statement.bai"
+    bai2_file.write_text("\n".join(lines) + "\n")
+    return BAI2Parser(load_config()).parse_file(bai2_file)
+
+
+def test_text_field_keeps_commas(tmp_path: Path) -> None:
+    """Type 16 text after the sixth comma is kept whole, commas included."""
+    (txn,) = parse_records(tmp_path, "16,115,125000,0,DEP001,CUST9,Invoices 1, 2, and 3/")
+
+    assert txn.description == "Invoices 1, 2, and 3"
+    assert txn.raw_data is not None
+    assert txn.raw_data["text"] == "Invoices 1, 2, and 3"
+    assert txn.raw_data["bank_reference"] == "DEP001"
+    assert txn.raw_data["customer_reference"] == "CUST9"
+    assert txn.date == date(2024, 11, 1)
+
+
+def test_short_record_pads_optional_fields(tmp_path: Path) -> None:
+    """A record without references or text gets empty optional fields."""
+    (txn,) = parse_records(tmp_path, "16,475,75000/")
+
+    assert txn.description == ""
+    assert txn.reference == ""
+    assert txn.amount == Decimal("750")
+    assert txn.raw_data is not None
+    assert txn.raw_data["funds_type"] == ""
+    assert txn.raw_data["bank_reference"] == ""
+    assert txn.raw_data["customer_reference"] == ""
+    assert txn.raw_data["text"] == ""
+
+
+@pytest.mark.parametrize("cents", [0, 5, 12300, 12340, 12345, -5, -12300, -12340, -12345])
+def test_cents_to_dollars_matches_decimal_division(cents: int) -> None:
+    """Dollar amounts equal Decimal division by 100, exponent included."""
+    expected = Decimal(cents) / 100
+    dollars = _cents_to_dollars(cents)
+
+    assert dollars == expected
+    assert dollars.as_tuple().exponent == expected.as_tuple().exponent
+    assert str(dollars) == str(expected)
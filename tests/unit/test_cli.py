@@ -0,0 +1,24 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SAMPLE_BAI2 = Path(__file__).parents[2] / "sample_data" / "bank_statement.bai"
+
+
+def test_parse_bai2_does_not_import_pandas() -> None:
+    """The BAI2 preview runs without loading pandas (used only by the Intacct parser)."""
+    script = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from bai_intacct_recon.cli import main\n"
+        f"result = CliRunner().invoke(main, ['parse-bai2', {str(SAMPLE_BAI2)!r}])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "False"
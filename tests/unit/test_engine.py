@@ -0,0 +1,143 @@
+"""Tests for the reconciliation engine."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from bai_intacct_recon.config import ReconConfig, load_config
+from bai_intacct_recon.matching import strategies
+from bai_intacct_recon.matching.engine import ReconciliationEngine
+from bai_intacct_recon.models.transaction import (
+    MatchResult,
+    NormalizedTransaction,
+    TransactionSource,
+    TransactionType,
+)
+
+# A single description tier (no date tolerance rule, so it maps to
+# FuzzyDescriptionStrategy)
+FUZZY_DESCRIPTION_CONFIG = """
+matching:
+  tiers:
+    - name: fuzzy_description
+      priority: 1
+      enabled: true
+      rules:
+        - field: description
+          match_type: fuzzy
+          similarity_threshold: 0.6
+          required: true
+        - field: amount
+          match_type: exact
+          required: true
+"""
+
+WORDS = ["acme", "payroll", "wire", "deposit", "vendor", "supply", "rent", "utility"]
+
+
+def make_transactions(
+    count: int, seed: int = 7
+) -> tuple[list[NormalizedTransaction], list[NormalizedTransaction]]:
+    """Build bank and Intacct transactions that match across every tier."""
+    rnd = random.Random(seed)
+    references = [f"REF-{i}" for i in range(count // 3)]
+    start = date(2024, 11, 1)
+
+    bank: list[NormalizedTransaction] = []
+    intacct: list[NormalizedTransaction] = []
+    for i in range(count):
+        amount = Decimal(rnd.choice([100, 250, 999, 1234])) + Decimal(rnd.randint(0, 3)) / 4
+        txn_type = rnd.choice(list(TransactionType))
+        reference = rnd.choice(references) if rnd.random() < 0.8 else None
+        txn_date = start + timedelta(days=rnd.randint(0, 20))
+        description = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3)))
+
+        bank.append(
+            NormalizedTransaction(
+                id=f"B{i}",
+                source=TransactionSource.BAI2,
+                date=txn_date,
+                amount=amount,
+                type=txn_type,
+                reference=reference,
+                description=description,
+                bai2_type_code=rnd.choice([165, 475, 195]),
+            )
+        )
+
+        if rnd.random() < 0.85:
+            intacct.append(
+                NormalizedTransaction(
+                    id=f"G{i}",
+                    source=TransactionSource.INTACCT,
+                    date=txn_date + timedelta(days=rnd.choice([0, 0, 1, -2, 3, 9])),
+                    amount=amount + Decimal(rnd.choice([0, 0, 0, 1, 5])),
+                    type=txn_type,
+                    reference=reference if rnd.random() < 0.7 else rnd.choice(references),
+                    description=description if rnd.random() < 0.5 else rnd.choice(WORDS),
+                    gl_account="1000-Cash",
+                )
+            )
+
+    rnd.shuffle(intacct)
+    return bank, intacct
+
+
+def match_summary(matches: list[MatchResult]) -> list[tuple[object, ...]]:
+    """Reduce match results to comparable values."""
+    return [
+        (
+            m.bank_transaction.id,
+            [t.id for t in m.intacct_transactions],
+            m.match_tier,
+            m.match_score,
+            m.match_reason,
+            m.amount_variance,
+            m.date_variance_days,
+        )
+        for m in matches
+    ]
+
+
+def parallel_config(workers: int) -> ReconConfig:
+    """Default configuration with sharded tiers enabled for small inputs."""
+    config = load_config()
+    config.matching.settings.parallel_workers = workers
+    config.matching.settings.parallel_min_transactions = 10
+    return config
+
+
+def test_sharded_matching_matches_serial() -> None:
+    """Matching on a worker pool gives the same results as the serial path."""
+    bank, intacct = make_transactions(600)
+
+    serial = ReconciliationEngine(parallel_config(1)).reconcile(bank, intacct)
+    sharded = ReconciliationEngine(parallel_config(3)).reconcile(bank, intacct)
+
+    serial_matches, serial_bank_only, serial_intacct_only = serial
+    sharded_matches, sharded_bank_only, sharded_intacct_only = sharded
+
+    assert len({m.match_tier for m in serial_matches}) > 1
+    assert match_summary(sharded_matches) == match_summary(serial_matches)
+    assert [t.id for t in sharded_bank_only] == [t.id for t in serial_bank_only]
+    assert [t.id for t in sharded_intacct_only] == [t.id for t in serial_intacct_only]
+
+
+def test_rapidfuzz_pruning_matches_difflib(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pruning candidates with the rapidfuzz bound does not change any match."""
+    pytest.importorskip("rapidfuzz")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(FUZZY_DESCRIPTION_CONFIG)
+    bank, intacct = make_transactions(400, seed=11)
+
+    pruned = ReconciliationEngine(load_config(config_file)).reconcile(bank, intacct)
+    monkeypatch.setattr(strategies, "_indel_ratio", None)
+    unpruned = ReconciliationEngine(load_config(config_file)).reconcile(bank, intacct)
+
+    assert len(unpruned[0]) > 0
+    assert match_summary(pruned[0]) == match_summary(unpruned[0])
+    assert [t.id for t in pruned[1]] == [t.id for t in unpruned[1]]
+    assert [t.id for t in pruned[2]] == [t.id for t in unpruned[2]]
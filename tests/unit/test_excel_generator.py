@@ -0,0 +1,62 @@
+"""Tests for the Excel report generator."""
+
+from datetime import datetime
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from bai_intacct_recon.config import load_config
+from bai_intacct_recon.matching.engine import ReconciliationEngine
+from bai_intacct_recon.parsers.bai2_parser import BAI2Parser
+from bai_intacct_recon.parsers.intacct_parser import IntacctParser
+from bai_intacct_recon.reports.excel_generator import ExcelReportGenerator
+
+SAMPLE_DATA = Path(__file__).parents[2] / "sample_data"
+MATCHED_AT = datetime(2024, 12, 1, 9, 30, 15, 123456)
+
+
+def write_report(output_path: Path, config_path: Path | None = None) -> Path:
+    """Reconcile the sample files and write the report."""
+    config = load_config(config_path)
+    bank = BAI2Parser(config).parse_file(SAMPLE_DATA / "bank_statement.bai")
+    intacct = IntacctParser(config).parse_file(SAMPLE_DATA / "sage_intacct_transactions.csv")
+    engine = ReconciliationEngine(config)
+    matches, bank_only, intacct_only = engine.reconcile(bank, intacct)
+    for match in matches:
+        match.matched_at = MATCHED_AT
+    summary = engine.generate_summary(
+        bank, intacct, matches, bank_only, intacct_only, "bank.bai", "gl.csv", 1.5
+    )
+    summary.reconciliation_date = MATCHED_AT
+
+    generator = ExcelReportGenerator(config)
+    return generator.generate_report(summary, matches, bank_only, intacct_only, output_path)
+
+
+def test_timestamps_use_second_precision(tmp_path: Path) -> None:
+    """Summary and audit timestamps are written as YYYY-MM-DD HH:MM:SS text."""
+    workbook = load_workbook(write_report(tmp_path / "report.xlsx"))
+
+    summary_values = [cell.value for row in workbook["Summary"].iter_rows() for cell in row]
+    assert "2024-12-01 09:30:15" in summary_values
+
+    audit = workbook["Audit Trail"]
+    header_row = next(row[0].row for row in audit.iter_rows() if row[0].value == "Timestamp")
+    first_log_row = audit[header_row + 1]
+    assert first_log_row[0].value == "2024-12-01 09:30:15"
+
+
+def test_disabled_sheets_are_omitted(tmp_path: Path) -> None:
+    """Only enabled sheets are written, including when all match-based sheets are off."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "output:\n"
+        "  sheets:\n"
+        "    matched: {enabled: false, name: Matched Transactions}\n"
+        "    amount_variances: {enabled: false, name: Amount Variances}\n"
+        "    audit_trail: {enabled: false, name: Audit Trail}\n"
+    )
+
+    workbook = load_workbook(write_report(tmp_path / "report.xlsx", config_file))
+
+    assert workbook.sheetnames == ["Summary", "Bank Only", "Intacct Only"]
@@ -0,0 +1,152 @@
+"""Tests for the Sage Intacct CSV parser."""
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from bai_intacct_recon.cli import PREVIEW_ROWS, main
+from bai_intacct_recon.config import load_config
+from bai_intacct_recon.models.transaction import NormalizedTransaction
+from bai_intacct_recon.parsers import intacct_parser
+from bai_intacct_recon.parsers.intacct_parser import IntacctParser
+
+HEADER = "Date,Description,Debit,Credit,Reference,Vendor,GL_Account,Transaction_ID"
+
+
+def write_csv(path: Path, rows: int, bad_date_rows: frozenset[int] = frozenset()) -> Path:
+    """Write an Intacct CSV; rows listed in bad_date_rows have an invalid date."""
+    lines = [HEADER]
+    for i in range(rows):
+        txn_date = "not-a-date" if i in bad_date_rows else f"11/{i % 28 + 1:02d}/2024"
+        lines.append(f"{txn_date},Payment {i},,{100 + i}.25,REF-{i},Vendor {i},1000-Cash,TXN-{i}")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_limit_counts_transactions_not_rows(tmp_path: Path) -> None:
+    """Rows skipped before the cut-off do not count towards the limit."""
+    csv_file = write_csv(tmp_path / "gl.csv", 30, frozenset({0, 2, 4, 6, 8}))
+    parser = IntacctParser(load_config())
+
+    preview = parser.parse_file(csv_file, limit=21)
+    full = parser.parse_file(csv_file)
+
+    assert len(full) == 25
+    assert [t.id for t in preview] == [t.id for t in full[:21]]
+
+
+def test_limit_larger_than_file(tmp_path: Path) -> None:
+    """A limit past the end of the file returns every transaction."""
+    csv_file = write_csv(tmp_path / "gl.csv", 10, frozenset({3}))
+    parser = IntacctParser(load_config())
+
+    preview = parser.parse_file(csv_file, limit=21)
+
+    assert [t.id for t in preview] == [t.id for t in parser.parse_file(csv_file)]
+    assert len(preview) == 9
+
+
+def test_parse_intacct_preview_footer(tmp_path: Path) -> None:
+    """The preview reports the true count when the file fits, and more otherwise."""
+    runner = CliRunner()
+
+    small = write_csv(tmp_path / "small.csv", PREVIEW_ROWS + 5, frozenset(range(0, 10, 2)))
+    result = runner.invoke(main, ["parse-intacct", str(small)])
+    assert result.exit_code == 0
+    assert f"Total transactions: {PREVIEW_ROWS}" in result.output
+
+    large = write_csv(tmp_path / "large.csv", PREVIEW_ROWS + 6, frozenset(range(0, 10, 2)))
+    result = runner.invoke(main, ["parse-intacct", str(large)])
+    assert result.exit_code == 0
+    assert "file contains more" in result.output
+
+
+MIXED_ROWS = [
+    "11/01/2024,Customer Payment,,1250.00,DEP001,Customer ABC,1000-Cash,TXN-001",
+    "11/02/2024,Office Supplies,75.50,,CHK10001,,2000-AP,TXN-002",
+    "not-a-date,Skipped Row,,10.00,REF-X,Vendor,1000-Cash,TXN-003",
+    '11/03/2024,"Wire, incoming",,"5,000.00",,Vendor Inc,1000-Cash,TXN-004',
+    "11/04/2024,No Amount,,,REF-5,Vendor,1000-Cash,TXN-005",
+    "11/05/2024,Numeric Reference,$20.00,,12345,Vendor,1200-Inv,",
+]
+
+
+def transaction_values(transactions: list[NormalizedTransaction]) -> list[tuple[object, ...]]:
+    """Reduce transactions to comparable values (raw_data NaNs compare unequal)."""
+    return [
+        (
+            t.id,
+            t.date,
+            t.amount,
+            t.type,
+            t.reference,
+            t.description,
+            t.vendor,
+            t.gl_account,
+            t.intacct_transaction_id,
+        )
+        for t in transactions
+    ]
+
+
+@pytest.fixture
+def mixed_csv(tmp_path: Path) -> Path:
+    """CSV with quoted fields, blanks, a skipped row and a numeric reference."""
+    csv_file = tmp_path / "mixed.csv"
+    csv_file.write_text("\n".join([HEADER, *MIXED_ROWS]) + "\n")
+    return csv_file
+
+
+def test_pyarrow_and_pandas_readers_agree(mixed_csv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The PyArrow reader, pandas reader and PyArrow fallback give the same transactions."""
+    pytest.importorskip("pyarrow")
+    parser = IntacctParser(load_config())
+
+    monkeypatch.setattr(intacct_parser, "_HAS_PYARROW", True)
+    with_pyarrow = parser.parse_file(mixed_csv)
+
+    monkeypatch.setattr(intacct_parser, "_HAS_PYARROW", False)
+    with_pandas = parser.parse_file(mixed_csv)
+
+    # A file PyArrow rejects is re-read with the pandas engine
+    read_csv = pd.read_csv
+
+    def reject_pyarrow(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        if kwargs.get("engine") == "pyarrow":
+            raise ValueError("unsupported by pyarrow")
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(intacct_parser, "_HAS_PYARROW", True)
+    monkeypatch.setattr(intacct_parser.pd, "read_csv", reject_pyarrow)
+    with_fallback = parser.parse_file(mixed_csv)
+
+    assert len(with_pandas) == 4
+    assert transaction_values(with_pyarrow) == transaction_values(with_pandas)
+    assert transaction_values(with_fallback) == transaction_values(with_pandas)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 10])
+def test_limited_read_matches_full_read(mixed_csv: Path, limit: int) -> None:
+    """The chunked preview read returns the first transactions of the full read."""
+    parser = IntacctParser(load_config())
+
+    preview = parser.parse_file(mixed_csv, limit=limit)
+
+    assert transaction_values(preview) == transaction_values(parser.parse_file(mixed_csv)[:limit])
+
+
+def test_parallel_parse_matches_serial(tmp_path: Path) -> None:
+    """Splitting rows across worker processes keeps order, IDs and values."""
+    csv_file = write_csv(tmp_path / "gl.csv", 200, frozenset({3, 50, 101, 199}))
+    parser = IntacctParser(load_config())
+    serial = parser.parse_file(csv_file)
+
+    parser.parallel_workers = 3
+    parser.parallel_min_rows = 10
+    parallel = parser.parse_file(csv_file)
+
+    assert len(serial) == 196
+    assert transaction_values(parallel) == transaction_values(serial)
@@ -0,0 +1,66 @@
+"""Tests for the logging configuration."""
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from bai_intacct_recon.config import load_config
+from bai_intacct_recon.parsers.intacct_parser import IntacctParser
+from bai_intacct_recon.utils import logging_config
+from bai_intacct_recon.utils.logging_config import setup_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_logging() -> Iterator[None]:
+    """Undo setup_logging's global changes after each test."""
+    yield
+    if logging_config._LISTENER is not None:
+        logging_config._LISTENER.stop()
+    logging_config._LISTENER = None
+    logging_config._WORKER_LOG_ARGS = None
+    logging.getLogger("bai_intacct_recon").handlers = []
+    logging.logThreads = logging.logProcesses = logging.logMultiprocessing = True
+
+
+def flush_log() -> None:
+    """Write any queued records to the log file."""
+    assert logging_config._LISTENER is not None
+    logging_config._LISTENER.stop()
+    logging_config._LISTENER = None
+
+
+def test_log_file_created_on_first_record(tmp_path: Path) -> None:
+    """The log file is opened lazily and receives records through the queue."""
+    log_file = tmp_path / "logs" / "recon.log"
+    setup_logging(logging.INFO, log_file)
+    assert not log_file.exists()
+
+    logging.getLogger("bai_intacct_recon.test").warning("first record")
+    flush_log()
+
+    assert "WARNING - test_logging_config.py:" in log_file.read_text()
+    assert "first record" in log_file.read_text()
+
+
+def test_worker_records_reach_log_file(tmp_path: Path) -> None:
+    """Records logged in parser worker processes are written to the log file."""
+    lines = ["Date,Description,Debit,Credit,Reference,Vendor,GL_Account,Transaction_ID"]
+    lines += [f"11/01/2024,Row {i},,{i + 1}.00,REF-{i},V,1000-Cash,TXN-{i}" for i in range(40)]
+    lines[5] = "bad-date,Row 4,,5.00,REF-4,V,1000-Cash,TXN-4"
+    lines[30] = "bad-date,Row 29,,30.00,REF-29,V,1000-Cash,TXN-29"
+    csv_file = tmp_path / "gl.csv"
+    csv_file.write_text("\n".join(lines) + "\n")
+
+    log_file = tmp_path / "recon.log"
+    setup_logging(logging.INFO, log_file)
+    parser = IntacctParser(load_config())
+    parser.parallel_workers = 4
+    parser.parallel_min_rows = 10
+    assert len(parser.parse_file(csv_file)) == 38
+    flush_log()
+
+    log_text = log_file.read_text()
+    assert "Row 4: Invalid date, skipping" in log_text
+    assert "Row 29: Invalid date, skipping" in log_text
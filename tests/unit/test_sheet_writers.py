@@ -0,0 +1,128 @@
+"""Tests for the Excel report sheet writers."""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+from openpyxl import load_workbook
+
+from bai_intacct_recon.config import load_config
+from bai_intacct_recon.matching.engine import ReconciliationEngine
+from bai_intacct_recon.parsers.bai2_parser import BAI2Parser
+from bai_intacct_recon.parsers.intacct_parser import IntacctParser
+from bai_intacct_recon.reports import excel_generator, sheet_writers
+from bai_intacct_recon.reports.excel_generator import ExcelReportGenerator
+from bai_intacct_recon.reports.sheet_writers import open_workbook
+from bai_intacct_recon.utils.exceptions import ReportGenerationError
+
+SAMPLE_DATA = Path(__file__).parents[2] / "sample_data"
+GENERATED_AT = datetime(2024, 12, 1, 9, 30, 15)
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() is fixed, so both reports carry the same timestamp."""
+
+    @classmethod
+    def now(cls, tz: Any = None) -> "_FixedDatetime":
+        return cls.fromtimestamp(GENERATED_AT.timestamp(), tz)
+
+
+def write_sample_report(output_path: Path, excel_engine: str) -> Path:
+    """Reconcile the sample files and write the report with the given engine."""
+    config = load_config()
+    config.output.excel = config.output.excel.model_copy(update={"engine": excel_engine})
+
+    bank = BAI2Parser(config).parse_file(SAMPLE_DATA / "bank_statement.bai")
+    intacct = IntacctParser(config).parse_file(SAMPLE_DATA / "sage_intacct_transactions.csv")
+    engine = ReconciliationEngine(config)
+    matches, bank_only, intacct_only = engine.reconcile(bank, intacct)
+    for match in matches:
+        match.matched_at = GENERATED_AT
+    summary = engine.generate_summary(
+        bank, intacct, matches, bank_only, intacct_only, "bank.bai", "gl.csv", 1.5
+    )
+    summary.reconciliation_date = GENERATED_AT
+
+    generator = ExcelReportGenerator(config)
+    return generator.generate_report(summary, matches, bank_only, intacct_only, output_path)
+
+
+def cell_snapshot(path: Path) -> dict[str, Any]:
+    """Read back values and formatting that both backends must agree on."""
+    workbook = load_workbook(path)
+    snapshot: dict[str, Any] = {}
+    for ws in workbook.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for cell in row:
+                # xlsxwriter stores empty strings as blank cells
+                value: Optional[Any] = None if cell.value == "" else cell.value
+                fill = cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type else None
+                # A font without a size uses the default size of 11
+                size = int(cell.font.sz or 11)
+                style = (fill, bool(cell.font.b), size, cell.border.left.style)
+                if value is None and style == (None, False, 11, None):
+                    continue
+                number_format = cell.number_format if cell.is_date else None
+                cells[cell.coordinate] = (value, number_format, style)
+        # Adjacent columns of equal width may be stored as one range
+        widths = {
+            column: round(dim.width)
+            for dim in ws.column_dimensions.values()
+            if dim.customWidth
+            for column in range(dim.min, dim.max + 1)
+        }
+        merges = sorted(str(merged) for merged in ws.merged_cells.ranges)
+        snapshot[ws.title] = (cells, merges, widths)
+    return snapshot
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fix the report's generated-at timestamp."""
+    monkeypatch.setattr(excel_generator, "datetime", _FixedDatetime)
+
+
+def test_xlsxwriter_report_matches_openpyxl(tmp_path: Path) -> None:
+    """Both backends write the same values, formats, fills, borders and merges."""
+    pytest.importorskip("xlsxwriter")
+
+    openpyxl_report = write_sample_report(tmp_path / "openpyxl.xlsx", "openpyxl")
+    xlsxwriter_report = write_sample_report(tmp_path / "xlsxwriter.xlsx", "xlsxwriter")
+
+    expected = cell_snapshot(openpyxl_report)
+    actual = cell_snapshot(xlsxwriter_report)
+
+    assert list(actual) == list(expected)
+    for sheet_name, (cells, merges, widths) in expected.items():
+        actual_cells, actual_merges, actual_widths = actual[sheet_name]
+        assert actual_cells == cells, sheet_name
+        assert actual_merges == merges, sheet_name
+        # xlsxwriter adds the column padding Excel applies to character widths
+        assert actual_widths.keys() == widths.keys(), sheet_name
+        for column, width in widths.items():
+            assert abs(actual_widths[column] - width) <= 1, (sheet_name, column)
+
+
+def test_unknown_engine_raises(tmp_path: Path) -> None:
+    """An unrecognized engine name is a report generation error."""
+    with pytest.raises(ReportGenerationError, match="Unknown Excel engine 'xlsx'"):
+        open_workbook("xlsx", tmp_path / "report.xlsx")
+
+
+def test_missing_xlsxwriter_falls_back_to_openpyxl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Requesting xlsxwriter without it installed writes the report with openpyxl."""
+    monkeypatch.setattr(sheet_writers, "xlsxwriter", None)
+
+    with caplog.at_level(logging.WARNING, logger=sheet_writers.__name__):
+        workbook = open_workbook("xlsxwriter", tmp_path / "report.xlsx")
+
+    assert isinstance(workbook, sheet_writers._OpenpyxlWorkbookWriter)
+    assert "xlsxwriter is not installed" in caplog.text
+
+    report = write_sample_report(tmp_path / "fallback.xlsx", "xlsxwriter")
+    assert load_workbook(report).sheetnames == list(excel_generator.DEFAULT_SHEET_NAMES.values())